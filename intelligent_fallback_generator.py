@@ -34,7 +34,7 @@ import re
 import subprocess
 import sys
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
@@ -54,11 +54,34 @@ except ImportError:
     UNIFIED_GENERATOR_AVAILABLE = False
 
 
-@dataclass
+# Weight factors for health calculation
+HEALTH_SUCCESS_WEIGHT = 0.4
+HEALTH_RESPONSE_WEIGHT = 0.3
+HEALTH_ERROR_WEIGHT = 0.2
+HEALTH_CONSECUTIVE_WEIGHT = 0.1
+
+
+def _health_score(success_rate: float, response_time: float,
+                  error_count: int, consecutive_failures: int) -> float:
+    """Weighted health score for an available framework (0.0 to 1.0)."""
+    # Normalize metrics to 0-1 scale
+    response_score = max(0, 1 - (response_time / 60))  # 60s max
+    error_score = max(0, 1 - (error_count / 10))  # 10 errors max
+    consecutive_score = max(0, 1 - (consecutive_failures / 5))  # 5 failures max
+    
+    return (
+        HEALTH_SUCCESS_WEIGHT * success_rate +
+        HEALTH_RESPONSE_WEIGHT * response_score +
+        HEALTH_ERROR_WEIGHT * error_score +
+        HEALTH_CONSECUTIVE_WEIGHT * consecutive_score
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class HealthMetrics:
     """Health and performance metrics for a framework."""
     framework: str
-    timestamp: datetime
+    timestamp_ns: int  # time.monotonic_ns() at creation
     response_time: float
     success_rate: float
     error_count: int
@@ -73,24 +96,9 @@ class HealthMetrics:
         """Calculate overall health score (0.0 to 1.0)."""
         if not self.api_available:
             return 0.0
-        
-        # Weight factors for health calculation
-        success_weight = 0.4
-        response_weight = 0.3
-        error_weight = 0.2
-        consecutive_weight = 0.1
-        
-        # Normalize metrics to 0-1 scale
-        success_score = self.success_rate
-        response_score = max(0, 1 - (self.response_time / 60))  # 60s max
-        error_score = max(0, 1 - (self.error_count / 10))  # 10 errors max
-        consecutive_score = max(0, 1 - (self.consecutive_failures / 5))  # 5 failures max
-        
-        return (
-            success_weight * success_score +
-            response_weight * response_score +
-            error_weight * error_score +
-            consecutive_weight * consecutive_score
+        return _health_score(
+            self.success_rate, self.response_time,
+            self.error_count, self.consecutive_failures
         )
 
 
@@ -189,7 +197,7 @@ class FailureDetector:
     def should_trigger_switch(self, metrics: HealthMetrics) -> Tuple[bool, str]:
         """Determine if a framework switch should be triggered."""
         
-        # Immediate triggers
+        # Cheapest and most selective checks first so common failures exit early
         if not metrics.api_available:
             return True, "API unavailable"
         
@@ -197,14 +205,16 @@ class FailureDetector:
             return True, f"Consecutive failures exceeded threshold ({metrics.consecutive_failures})"
         
         # Error rate threshold
-        if metrics.total_tasks > 5:  # Only check after sufficient sample size
-            error_rate = metrics.error_count / metrics.total_tasks
+        total_tasks = metrics.total_tasks
+        if total_tasks > 5:  # Only check after sufficient sample size
+            error_rate = metrics.error_count / total_tasks
             if error_rate > self.error_rate_threshold:
                 return True, f"Error rate too high ({error_rate:.2f})"
         
-        # Health score threshold
-        if metrics.health_score < 0.3:
-            return True, f"Health score too low ({metrics.health_score:.2f})"
+        # Health score threshold (most expensive, computed once)
+        health_score = metrics.health_score
+        if health_score < 0.3:
+            return True, f"Health score too low ({health_score:.2f})"
         
         return False, ""
 
@@ -242,18 +252,32 @@ class PerformanceMonitor:
         if not success:
             consecutive_failures += 1
         
+        # Calculate rolling metrics over the window this entry will close
+        success_rate = 1.0 if success else 0.0
+        error_count = 1 if error else 0
+        tasks_completed = recent_successes + (1 if success else 0)
+        total_tasks = recent_tasks + 1
+        
+        kept = history[max(0, len(history) - self.window_size + 1):]
+        if kept:
+            kept_successes = sum(1 for m in kept if m.success_rate > 0)
+            success_rate = (kept_successes + (1 if success else 0)) / (len(kept) + 1)
+            error_count += sum(m.error_count for m in kept)
+            tasks_completed = kept_successes + (1 if success_rate > 0 else 0)
+            total_tasks = len(kept) + 1
+        
         # Create new metrics entry
         metrics = HealthMetrics(
             framework=framework,
-            timestamp=datetime.now(),
+            timestamp_ns=time.monotonic_ns(),
             response_time=response_time,
-            success_rate=1.0 if success else 0.0,
-            error_count=1 if error else 0,
+            success_rate=success_rate,
+            error_count=error_count,
             last_error=error,
             consecutive_failures=consecutive_failures,
             api_available=True,  # Will be updated by health checker
-            tasks_completed=recent_successes + (1 if success else 0),
-            total_tasks=recent_tasks + 1
+            tasks_completed=tasks_completed,
+            total_tasks=total_tasks
         )
         
         # Add to history and trim if needed
@@ -261,13 +285,6 @@ class PerformanceMonitor:
         if len(history) > self.window_size:
             history.pop(0)
         
-        # Calculate rolling metrics
-        if len(history) > 1:
-            metrics.success_rate = sum(1 for m in history if m.success_rate > 0) / len(history)
-            metrics.error_count = sum(m.error_count for m in history)
-            metrics.tasks_completed = sum(1 for m in history if m.success_rate > 0)
-            metrics.total_tasks = len(history)
-        
         self.logger.debug(f"Updated {framework} metrics: health={metrics.health_score:.2f}")
         return metrics
     
@@ -277,6 +294,14 @@ class PerformanceMonitor:
             return None
         return self.metrics_history[framework][-1]
     
+    def set_api_available(self, framework: str, available: bool) -> Optional[HealthMetrics]:
+        """Record API availability on the latest metrics entry for a framework."""
+        history = self.metrics_history.get(framework)
+        if not history:
+            return None
+        history[-1] = replace(history[-1], api_available=available)
+        return history[-1]
+    
     async def check_api_availability(self, framework: str) -> bool:
         """Check if a framework's API is available."""
         try:
@@ -563,7 +588,8 @@ class IntelligentFallbackGenerator:
             )
             
             # Check API availability
-            metrics.api_available = await self.performance_monitor.check_api_availability(framework)
+            api_available = await self.performance_monitor.check_api_availability(framework)
+            metrics = self.performance_monitor.set_api_available(framework, api_available)
             
             if success:
                 self.logger.info(f"🎉 Successfully completed with {framework}")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for API Availability Checker
+==================================
+
+Unit tests for coalescing concurrent provider health checks.
+"""
+
+import asyncio
+import time
+import unittest
+
+try:
+    import aiohttp
+    from utils.api_checker import APIChecker, APIHealthResult
+except ImportError:
+    aiohttp = None
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp not installed")
+class TestAPIChecker(unittest.TestCase):
+    """Test in-flight sharing of health probes."""
+
+    def test_concurrent_checks_share_one_probe(self):
+        """Test that concurrent callers share a single probe, healthy or not."""
+        checker = APIChecker()
+        probes = []
+
+        async def probe(provider):
+            probes.append(provider)
+            await asyncio.sleep(0.05)
+            return APIHealthResult(provider, False, 0.05, None, "HTTP 503", time.time())
+
+        checker._check_provider_health_uncached = probe
+
+        async def check_many():
+            return await asyncio.gather(*(checker.check_provider_health("openai") for _ in range(5)))
+
+        results = asyncio.run(check_many())
+        self.assertEqual(probes, ["openai"])
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertFalse(results[0].available)
+
+        # Failures are not cached, so a later check probes again
+        asyncio.run(checker.check_provider_health("openai"))
+        self.assertEqual(probes, ["openai", "openai"])
+
+
+if __name__ == "__main__":
+    unittest.main()
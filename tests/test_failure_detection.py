@@ -6,8 +6,13 @@ Tests for Failure Detection Engine
 Unit tests for the failure detection and log analysis components.
 """
 
+import os
+import random
+import tempfile
 import unittest
+from unittest import mock
 from utils.log_analyzer import LogAnalyzer, LogAnalysisResult
+from utils.log_analyzer import HYPERSCAN_AVAILABLE, _HyperscanScanner, _PatternSet, _hyperscan_scanner
 
 
 class TestFailureDetection(unittest.TestCase):
@@ -35,6 +40,14 @@ class TestFailureDetection(unittest.TestCase):
         self.assertEqual(result.error_type, "rate_limiting")
         self.assertEqual(result.severity, "critical")
     
+    def test_first_critical_category_wins(self):
+        """Test that only the first matching critical category is reported."""
+        log_content = "ERROR: API key is invalid\nERROR: connection refused by host"
+        result = self.analyzer.analyze_log_content(log_content)
+
+        self.assertEqual(result.error_type, "authentication")
+        self.assertEqual(result.error_patterns, ["API key.*invalid"])
+
     def test_claude_specific_errors(self):
         """Test Claude-specific error patterns."""
         log_content = "ERROR: Claude session failed to initialize"
@@ -60,6 +73,77 @@ class TestFailureDetection(unittest.TestCase):
         self.assertFalse(result.has_errors)
         self.assertIsNone(result.error_type)
         self.assertEqual(result.severity, "low")
+    
+    def test_log_file_analysis(self):
+        """Test analysis of a memory-mapped log file, including an empty one."""
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = os.path.join(tmp, "claude.log")
+            with open(log_path, "w", encoding="utf-8") as f:
+                f.write("INFO: starting\nERROR: Claude session failed to initialize\n")
+            result = self.analyzer.analyze_log_file(log_path, framework="claude")
+            
+            self.assertTrue(result.has_errors)
+            self.assertEqual(result.error_type, "claude_specific")
+            self.assertIn("claude.*session.*failed", result.error_patterns)
+            
+            empty_path = os.path.join(tmp, "empty.log")
+            open(empty_path, "w").close()
+            self.assertFalse(self.analyzer.analyze_log_file(empty_path).has_errors)
+
+    def test_error_metrics_extraction(self):
+        """Test per-line level counts, response times and timestamp range."""
+        log_content = (
+            "2024-01-02 03:04:05 ERROR request failed after 2.5 seconds\n"
+            "2024-01-02 03:04:01 warning: retry took 1 second, then 4 seconds\n"
+            "CRITICAL and WARNING on the same line\n"
+            "INFO: 7\n"
+            "seconds\n"
+            "2024-01-02 03:05:00 info done"
+        )
+        metrics = self.analyzer.extract_error_metrics(log_content)
+
+        self.assertEqual(metrics["error_count"], 1)
+        self.assertEqual(metrics["warning_count"], 2)
+        self.assertEqual(metrics["critical_count"], 0)
+        self.assertEqual(metrics["response_times"], [2.5, 1.0])
+        first, last = metrics["timestamp_range"]
+        self.assertEqual(first.strftime("%H:%M:%S"), "03:04:01")
+        self.assertEqual(last.strftime("%H:%M:%S"), "03:05:00")
+        self.assertEqual(self.analyzer.extract_error_metrics(log_content.encode()), metrics)
+
+
+@unittest.skipUnless(HYPERSCAN_AVAILABLE, "hyperscan not installed")
+class TestHyperscanParity(unittest.TestCase):
+    """Test that the Hyperscan pass agrees with the re pattern sets."""
+
+    WORDS = [
+        "API key", "invalid", "Authentication", "FAILED", "rate limit", "exceeded",
+        "connection", "timeout", "refused", "Claude", "session", "mcp server",
+        "unavailable", "OpenCode", "provider", "module", "not", "found", "syntax",
+        "error", "runtime", "stack overflow", "\n", "x", "\t"
+    ]
+
+    def test_matches_re_scanner(self):
+        """Test identical matches on random logs, with tiny chunks to cross chunk boundaries."""
+        rng = random.Random(0)
+        pattern_sets = LogAnalyzer._ALL_SETS
+        scanner = _hyperscan_scanner(pattern_sets)
+        self.assertIsNotNone(scanner)
+
+        for chunk_size in (7, 1 << 20):
+            with mock.patch.object(_HyperscanScanner, "CHUNK_SIZE", chunk_size):
+                for _ in range(300):
+                    content = " ".join(rng.choice(self.WORDS) for _ in range(15)).encode("utf-8")
+                    expected = {}
+                    for pattern_set in pattern_sets:
+                        matches = pattern_set.matches(content)
+                        if matches:
+                            expected[pattern_set] = matches
+                    self.assertEqual(scanner.scan(content), expected, content)
+
+    def test_uncompilable_patterns_fall_back(self):
+        """Test that patterns Hyperscan rejects leave the re path in charge."""
+        self.assertIsNone(_hyperscan_scanner((_PatternSet([r"(a)\1"]),)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for Loop-Scoped Resources
+===============================
+
+Unit tests for sharing one async client per event loop.
+"""
+
+import asyncio
+import unittest
+from utils.loop_scoped import LoopScopedResource
+
+
+class _Client:
+    """Stand-in async client that records which loop closed it."""
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.closed_on = None
+
+    async def close(self):
+        self.closed_on = asyncio.get_running_loop()
+
+
+class TestLoopScopedResource(unittest.TestCase):
+    """Test per-loop sharing and cleanup."""
+
+    def setUp(self):
+        self.shared = LoopScopedResource(_Client, _Client.close)
+
+    def test_shared_within_loop_and_closed_on_shutdown(self):
+        """Test one client per asyncio.run, each closed on its own loop."""
+        async def get_twice():
+            return await asyncio.gather(self.shared.get(), self.shared.get())
+
+        first, again = asyncio.run(get_twice())
+        second, _ = asyncio.run(get_twice())
+
+        self.assertIs(first, again)
+        self.assertIsNot(first, second)
+        for client in (first, second):
+            self.assertIs(client.closed_on, client.loop)
+
+    def test_explicit_close(self):
+        """Test that close() releases the client and the next get() makes a new one."""
+        async def cycle():
+            client = await self.shared.get()
+            await self.shared.close()
+            return client, await self.shared.get()
+
+        closed, replacement = asyncio.run(cycle())
+        self.assertIs(closed.closed_on, closed.loop)
+        self.assertIsNot(closed, replacement)
+
+
+if __name__ == "__main__":
+    unittest.main()
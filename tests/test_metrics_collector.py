@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for Metrics Collection
+===========================
+
+Unit tests for metric recording, retention and summaries.
+"""
+
+import contextlib
+import json
+import unittest
+from unittest import mock
+from utils.metrics_collector import MetricsCollector
+
+
+class TestMetricsCollector(unittest.TestCase):
+    """Test metric recording and aggregation."""
+
+    def setUp(self):
+        self.collector = MetricsCollector(retention_hours=1)
+
+    def test_framework_summary(self):
+        """Test per-type statistics for one framework."""
+        for value in (2.0, 4.0, 9.0):
+            self.collector.record_metric("claude", "latency", value)
+        self.collector.record_metric("claude", "tokens", 100.0)
+        self.collector.record_metric("opencode", "latency", 50.0)
+
+        summary = self.collector.get_framework_summary("claude")
+
+        self.assertEqual(set(summary), {"latency", "tokens"})
+        latency = summary["latency"]
+        self.assertEqual(latency["count"], 3)
+        self.assertAlmostEqual(latency["avg"], 5.0)
+        self.assertEqual((latency["min"], latency["max"], latency["latest"]), (2.0, 9.0, 9.0))
+        self.assertAlmostEqual(latency["std"], 3.605551275463989)
+        self.assertNotIn("std", summary["tokens"])
+        self.assertEqual(self.collector.get_framework_summary("missing"), {"error": "No metrics found"})
+
+    @contextlib.contextmanager
+    def _clock(self, wall, monotonic):
+        """Pin the collector's wall-clock and monotonic readings."""
+        with mock.patch("utils.metrics_collector.time.time", return_value=wall), \
+                mock.patch("utils.metrics_collector.time.monotonic", return_value=monotonic):
+            yield
+
+    def test_retention_and_window(self):
+        """Test that expired points are dropped and summaries honour the time window."""
+        for offset, value in ((-5400, 1.0), (-1800, 2.0)):
+            with self._clock(20000 + offset, 10000 + offset):
+                self.collector.record_metric("claude", "latency", value)
+        with self._clock(20000, 10000):
+            self.collector.record_metric("claude", "latency", 3.0, {"run": 1})
+            self.collector._cleanup_old_metrics()
+
+            exported = self.collector.export_metrics()
+            self.assertEqual([point["value"] for point in exported], [2.0, 3.0])
+            self.assertEqual([point["timestamp"] for point in exported], [18200, 20000])
+            self.assertEqual(exported[-1]["metadata"], {"run": 1})
+            self.assertEqual(exported[-1]["framework"], "claude")
+            self.assertEqual(json.loads(self.collector.export_metrics_bytes()), exported)
+
+            summary = self.collector.get_framework_summary("claude", hours=0.25)
+            self.assertEqual(summary["latency"]["count"], 1)
+
+    def test_wall_clock_stepping_backwards(self):
+        """Test that a backwards wall-clock step does not expire points still within retention."""
+        walls = (10000, 10200, 10050, 10300, 10310)
+        for tick, (wall, value) in enumerate(zip(walls, (1.0, 2.0, 3.0, 4.0, 5.0))):
+            with self._clock(wall, 100 * tick):
+                self.collector.record_metric("claude", "latency", value)
+
+        # One hour after the second point: only the first has aged out
+        with self._clock(13800, 3700):
+            exported = self.collector.export_metrics()
+            self.assertEqual([point["value"] for point in exported], [2.0, 3.0, 4.0, 5.0])
+            self.assertEqual(exported[1]["timestamp"], 10050)
+            self.assertEqual(self.collector.get_framework_summary("claude")["latency"]["count"], 4)
+
+    def test_window_wider_than_retention(self):
+        """Test that summaries exclude expired points not yet removed by batched cleanup."""
+        with self._clock(10000, 0):
+            self.collector.record_metric("claude", "latency", 1.0)
+        with self._clock(17200, 7200):
+            self.collector.record_metric("claude", "latency", 2.0)
+            summary = self.collector.get_framework_summary("claude", hours=3)
+
+        self.assertEqual(summary["latency"]["count"], 1)
+        self.assertEqual(summary["latency"]["latest"], 2.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for OpenCode Generator
+============================
+
+Unit tests for concurrent simulated generation with the OpenCode generator.
+"""
+
+import asyncio
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import opencode_autonomous_generator
+from opencode_autonomous_generator import OpenCodeAutonomousGenerator
+
+
+class TestOpenCodeGenerator(unittest.TestCase):
+    """Test generate_code_many in simulation mode."""
+
+    def test_generate_two_projects_concurrently(self):
+        """Test two same-named tasks run side by side into separate project directories."""
+        # No SDK client: session setup fails and each run falls back to simulation
+        with mock.patch.object(opencode_autonomous_generator, "_load_opencode_sdk", return_value=object()):
+            generator = OpenCodeAutonomousGenerator(enable_simulation=True)
+        real_run_command = opencode_autonomous_generator._run_command
+        # [commands running now, most running at once]
+        in_flight = [0, 0]
+
+        async def run_command(*args, **kwargs):
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+            try:
+                return await real_run_command(*args, **kwargs)
+            finally:
+                in_flight[0] -= 1
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(opencode_autonomous_generator, "_run_command", run_command), \
+                contextlib.redirect_stdout(io.StringIO()):
+            tasks = [("Create a hello world program", tmp, "hello")] * 2
+            results = asyncio.run(generator.generate_code_many(tasks, concurrency=2))
+
+            project_dirs = [project_dir for project_dir, _ in results]
+            self.assertEqual([success for _, success in results], [True, True])
+            self.assertEqual(len(set(project_dirs)), 2)
+            # git and program runs from the two tasks overlapped instead of running back to back
+            self.assertEqual(in_flight[1], 2)
+            for project_dir in project_dirs:
+                self.assertTrue((Path(project_dir) / "src" / "main.py").exists())
+                self.assertTrue((Path(project_dir) / ".git").is_dir())
+
+
+if __name__ == "__main__":
+    unittest.main()
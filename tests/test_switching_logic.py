@@ -6,8 +6,8 @@ Tests for Switching Logic
 Unit tests for the intelligent framework switching engine.
 """
 
+import time
 import unittest
-from datetime import datetime
 from intelligent_fallback_generator import (
     HealthMetrics, SwitchingEngine, FailureDetector
 )
@@ -24,7 +24,7 @@ class TestSwitchingLogic(unittest.TestCase):
         """Test that healthy framework doesn't trigger switch."""
         healthy_metrics = HealthMetrics(
             framework="claude",
-            timestamp=datetime.now(),
+            timestamp_ns=time.monotonic_ns(),
             response_time=5.0,
             success_rate=0.9,
             error_count=0,
@@ -42,7 +42,7 @@ class TestSwitchingLogic(unittest.TestCase):
         """Test that consecutive failures trigger switch."""
         failing_metrics = HealthMetrics(
             framework="claude",
-            timestamp=datetime.now(),
+            timestamp_ns=time.monotonic_ns(),
             response_time=30.0,
             success_rate=0.0,
             error_count=5,
@@ -61,7 +61,7 @@ class TestSwitchingLogic(unittest.TestCase):
         """Test that API unavailability triggers immediate switch."""
         unavailable_metrics = HealthMetrics(
             framework="opencode",
-            timestamp=datetime.now(),
+            timestamp_ns=time.monotonic_ns(),
             response_time=0.0,
             success_rate=0.5,
             error_count=2,
@@ -80,7 +80,7 @@ class TestSwitchingLogic(unittest.TestCase):
         """Test health score calculation."""
         metrics = HealthMetrics(
             framework="claude",
-            timestamp=datetime.now(),
+            timestamp_ns=time.monotonic_ns(),
             response_time=10.0,
             success_rate=0.8,
             error_count=2,
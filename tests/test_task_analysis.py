@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Tests for Task Analysis
+======================
+
+Unit tests for task description parsing in the unified generator.
+"""
+
+import unittest
+from unified_autonomous_generator import _analyze_task
+
+
+class TestTaskAnalysis(unittest.TestCase):
+    """Test keyword-based task analysis."""
+
+    def test_language_detection(self):
+        """Test language detection, including the java/javascript overlap."""
+        self.assertEqual(_analyze_task("Create a JavaScript app")[0], "javascript")
+        self.assertEqual(_analyze_task("Create a Java program")[0], "java")
+        self.assertEqual(_analyze_task("Create a hello world program")[0], "python")
+
+    def test_substring_matching(self):
+        """Test that keywords embedded in longer words still match."""
+        language, complexity, features = _analyze_task("Build a webapp with a restful backend")
+        self.assertEqual(complexity, "web")
+        self.assertIn("api", features)
+
+    def test_feature_detection(self):
+        """Test detection of multiple feature flags in order."""
+        _, complexity, features = _analyze_task("CLI tool with GUI, SQL database and tests")
+        self.assertEqual(complexity, "cli")
+        self.assertEqual(features, ("gui", "database", "testing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
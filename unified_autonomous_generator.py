@@ -32,44 +32,588 @@ Based on Anthropic's "Effective harnesses for long-running agents" research.
 
 import argparse
 import asyncio
+import contextlib
+import copy
+import functools
+import importlib
+import io
 import json
+import mmap
 import os
+import re
+import runpy
+import shlex
+import shutil
+import stat
+import subprocess
 import sys
 import tempfile
-import subprocess
+import traceback
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 from abc import ABC, abstractmethod
 
-# Framework availability checks
-CLAUDE_SDK_AVAILABLE = False
-OPENCODE_SDK_AVAILABLE = False
+from utils.loop_scoped import LoopScopedResource
+
+# Framework SDKs are imported lazily, when a generator for that framework is
+# created, so running one framework never pays the other's import cost.
+_OPENCODE_SDK_LOCAL_PATH = '/Users/Mark/Software/autonomous-coding_Hello_World/opencode-sdk-python/src'
+
+
+@functools.lru_cache(maxsize=None)
+def _load_claude_client():
+    """Import the Claude client factory on first use; None if the SDK is unavailable."""
+    try:
+        create_client = importlib.import_module("client").create_client
+        print("✅ Claude SDK available")
+        return create_client
+    except ImportError:
+        print("ℹ️ Claude SDK not available")
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_opencode_sdk():
+    """Import the OpenCode SDK on first use, with local path fallback; None if unavailable."""
+    try:
+        try:
+            opencode_ai = importlib.import_module("opencode_ai")
+        except ImportError:
+            # Fallback to local OpenCode SDK
+            sys.path.insert(0, _OPENCODE_SDK_LOCAL_PATH)
+            opencode_ai = importlib.import_module("opencode_ai")
+        print("✅ OpenCode SDK available")
+        return opencode_ai
+    except ImportError as e:
+        print(f"ℹ️ OpenCode SDK not available: {e}")
+        return None
 
 try:
-    # Try Claude SDK import (would need to be adapted based on actual Claude SDK structure)
-    from client import create_client as create_claude_client
-    CLAUDE_SDK_AVAILABLE = True
-    print("✅ Claude SDK available")
+    # Optional faster JSON encoder for feature lists
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    print("ℹ️ Claude SDK not available")
+    ORJSON_AVAILABLE = False
 
-try:
-    # Try OpenCode SDK import with local path fallback
+# Files committed by the simulated Claude initializer agent
+_CLAUDE_SCAFFOLD_FILES = ("README.md", "init.sh", "claude-progress.txt", "feature_list.json")
+
+# Simulated Claude program templates keyed by (language, variant), filled with str.format
+_CLAUDE_HELLO_PY_TEMPLATE = '''#!/usr/bin/env python3
+"""
+Hello World Program - Generated by Claude SDK
+============================================
+
+A sophisticated Hello World implementation showcasing
+Claude Code SDK autonomous generation capabilities.
+
+Usage:
+    python3 main.py
+"""
+
+def main():
+    """
+    Main function demonstrating Claude SDK code generation.
+    
+    This function showcases the advanced reasoning capabilities
+    of Claude Code SDK for autonomous development.
+    """
+    print("Hello World")
+    print("Generated by Claude Code SDK Autonomous Agent!")
+    print("Powered by Anthropic's advanced reasoning")
+    
+def demonstrate_claude_capabilities():
+    """Showcase Claude SDK framework features."""
+    print("\\n=== Claude Code SDK Features ===")
+    print("✅ Advanced AI reasoning")
+    print("✅ MCP tool integration") 
+    print("✅ Security-conscious development")
+    print("✅ Context-aware code generation")
+    print("✅ Autonomous development workflows")
+
+if __name__ == "__main__":
+    main()
+    demonstrate_claude_capabilities()
+'''
+
+_CLAUDE_DEFAULT_PY_TEMPLATE = '''#!/usr/bin/env python3
+"""
+{description} - Generated by Claude SDK
+{underline}
+
+Advanced implementation using Claude Code SDK autonomous generation.
+
+Usage:
+    python3 main.py
+"""
+
+def main():
+    """Main program logic - Claude SDK generated."""
+    print("Claude Code SDK Autonomous Generation")
+    print("=" * 35)
+    print(f"Task: {description}")
+    print("Framework: Claude Code SDK")
+    print("Generated with advanced AI reasoning!")
+    return True
+
+if __name__ == "__main__":
+    main()
+'''
+
+_CLAUDE_FALLBACK_TEMPLATE = "# {description}\\n# Generated by Claude Code SDK\\nprint('Claude SDK - {language} program')"
+
+_CLAUDE_PROGRAM_TEMPLATES = {
+    ("python", "hello"): _CLAUDE_HELLO_PY_TEMPLATE,
+    ("python", "default"): _CLAUDE_DEFAULT_PY_TEMPLATE,
+}
+
+
+# Static prompt preambles. Task-specific context templates are appended after
+# these so every run shares the same prefix and benefits from prompt caching.
+_CLAUDE_INITIALIZER_PREAMBLE = """## INITIALIZER AGENT: Claude SDK Project Setup
+
+You are an expert developer using Claude Code SDK for autonomous development.
+The project description, language and working directory are given at the end of this prompt.
+
+### YOUR TASKS AS INITIALIZER AGENT:
+
+1. **EXAMINE PROJECT STRUCTURE**:
+   - The project directory has been created with src/, tests/, docs/ subdirectories
+   - Read feature_list.json to understand requirements
+   - Plan the implementation approach
+
+2. **CREATE PROJECT FOUNDATION**:
+   - Create README.md with comprehensive project documentation
+   - Set up main program files in src/ directory
+   - Create init.sh script for environment setup
+   - Initialize git repository with initial commit
+
+3. **PLAN IMPLEMENTATION STRATEGY**:
+   - Analyze the feature list requirements
+   - Plan file structure and dependencies
+   - Document the development approach
+   - Create progress tracking file (claude-progress.txt)
+
+4. **PREPARE FOR CODING AGENT**:
+   - Leave clear instructions for implementation
+   - Set up foundation without implementing core logic
+   - Create templates and structure for coding agent
+   - Document what needs to be implemented
+
+### CLAUDE SDK INTEGRATION:
+- Use MCP tools for file operations and testing
+- Leverage Claude's code generation capabilities
+- Follow security best practices with command allowlists
+
+### IMPORTANT:
+- Focus on PROJECT SETUP and PLANNING only
+- Do NOT implement the actual functionality yet
+- Create solid foundation for incremental development
+- Leave detailed instructions for the coding agent
+"""
+
+_CLAUDE_CODING_PREAMBLE = """## CODING AGENT: Claude SDK Incremental Development
+
+You are an expert developer continuing autonomous development with Claude Code SDK.
+The project description, language and working directory are given at the end of this prompt.
+
+### STEP-BY-STEP PROCESS (CRITICAL):
+
+1. **GET YOUR BEARINGS**:
+   - Run `pwd` to see your current directory
+   - Read claude-progress.txt to understand previous work
+   - Check git log to see what has been done: `git log --oneline -10`
+
+2. **READ REQUIREMENTS**:
+   - Read feature_list.json to see all features
+   - Find the HIGHEST PRIORITY feature that has "passes": false
+   - Focus on implementing ONE feature at a time
+
+3. **UNDERSTAND PROJECT STRUCTURE**:
+   - Examine existing files and project layout
+   - Read README.md for project documentation
+   - Run init.sh if it exists to set up environment
+
+4. **IMPLEMENT THE CHOSEN FEATURE**:
+   - Work on only ONE feature per session
+   - Follow the detailed steps in the feature definition
+   - Write clean, well-documented code in the project language
+   - Use Claude's advanced reasoning for complex logic
+
+5. **TEST YOUR IMPLEMENTATION**:
+   - Use available MCP tools to test the program
+   - Verify all steps listed in the feature requirements
+   - Fix any bugs or issues found
+   - Only mark feature as "passes": true when fully working
+
+6. **CLEAN UP AND DOCUMENT**:
+   - Ensure code is clean and well-commented
+   - Update feature_list.json to mark completed features
+   - Commit changes with descriptive git message
+   - Update claude-progress.txt with accomplishments
+
+### CLAUDE SDK CAPABILITIES:
+- Advanced code reasoning and generation
+- MCP tool integration for file operations
+- Security-conscious development practices
+- Context management across sessions
+
+### CRITICAL RULES:
+- **ONE FEATURE AT A TIME**: Never implement multiple features simultaneously
+- **THOROUGH TESTING**: Test everything before marking complete
+- **CLEAN STATE**: Leave working, documented code
+- **INCREMENTAL**: Make steady, verifiable progress
+"""
+
+_CLAUDE_INITIALIZER_CONTEXT = """
+### PROJECT DESCRIPTION:
+{description}
+
+### PROJECT ANALYSIS:
+- **Language**: {language}
+- **Complexity**: {complexity}
+- **Working Directory**: {project_dir}
+- **Framework**: Claude Code SDK
+
+Start by reading feature_list.json to understand the full requirements.
+"""
+
+_CLAUDE_CODING_CONTEXT = """
+### PROJECT DESCRIPTION:
+{description}
+
+### PROJECT LANGUAGE:
+{language}
+
+### YOUR WORKING DIRECTORY:
+{project_dir}
+
+Begin by reading claude-progress.txt and feature_list.json to understand current state.
+"""
+
+# OpenCode agent prompts; filled with format_map per call
+_OPENCODE_INITIALIZER_TEMPLATE = """## INITIALIZER AGENT: OpenCode Project Setup
+
+You are an expert {language} developer using OpenCode SDK for autonomous development.
+
+### PROJECT DESCRIPTION:
+{description}
+
+### FRAMEWORK: OpenCode SDK
+- Multi-provider AI support ({provider_id}/{model_id})
+- Session-based development workflow
+- Native file handling capabilities
+- Built-in development tools integration
+
+### YOUR TASKS AS INITIALIZER AGENT:
+
+1. **PROJECT SETUP**:
+   - Create comprehensive README.md with project documentation
+   - Set up init.sh script for environment configuration
+   - Initialize git repository with proper structure
+   - Create progress tracking file (claude-progress.txt)
+
+2. **FOUNDATION BUILDING**:
+   - Analyze feature_list.json requirements
+   - Plan implementation strategy
+   - Set up development environment
+   - Prepare for coding agent
+
+### OPENCODE INTEGRATION:
+- Use built-in terminal and editor tools
+- Leverage session-based development workflow
+- Utilize native file operations
+- Support multiple AI providers
+
+Focus on PROJECT SETUP only. Leave implementation for the coding agent.
+"""
+
+_OPENCODE_CODING_TEMPLATE = """## CODING AGENT: OpenCode Incremental Development
+
+You are an expert {language} developer using OpenCode SDK for autonomous implementation.
+
+### PROJECT DESCRIPTION:
+{description}
+
+### OPENCODE SESSION WORKFLOW:
+
+1. **GET BEARINGS**: Read claude-progress.txt and feature_list.json
+2. **SELECT FEATURE**: Choose ONE high-priority feature that's not complete
+3. **IMPLEMENT**: Write clean, tested {language} code
+4. **VALIDATE**: Test thoroughly before marking complete
+5. **DOCUMENT**: Update progress and commit changes
+
+### OPENCODE CAPABILITIES:
+- Multi-provider AI reasoning ({provider_id}/{model_id})
+- Built-in development tools
+- Session-based context management
+- Native file operations
+
+Work on ONE feature at a time. Test everything. Maintain clean state.
+"""
+
+
+# Keyword sets for task analysis
+_JAVASCRIPT_WORDS = frozenset({"javascript", "js", "node"})
+_PYTHON_WORDS = frozenset({"python", "py"})
+_WEB_WORDS = frozenset({"web", "app", "website", "server", "api"})
+_CLI_WORDS = frozenset({"cli", "command", "tool", "utility"})
+_LIBRARY_WORDS = frozenset({"library", "package", "module"})
+_GUI_WORDS = frozenset({"gui", "interface", "window"})
+_DATABASE_WORDS = frozenset({"database", "db", "sql"})
+_API_WORDS = frozenset({"api", "rest", "endpoint"})
+_TASK_KEYWORDS = (
+    _JAVASCRIPT_WORDS | _PYTHON_WORDS | _WEB_WORDS | _CLI_WORDS | _LIBRARY_WORDS |
+    _GUI_WORDS | _DATABASE_WORDS | _API_WORDS | {"java", "test"}
+)
+
+# One pass collects every keyword occurring anywhere in the task. The zero-width
+# lookahead finds overlapping and embedded occurrences ("webapp" yields both
+# "web" and "app"), so this keeps the substring semantics of the original
+# checks. Longest alternatives come first; the only cross-category prefix pair
+# is java/javascript, where "java" is ignored whenever "javascript" is present.
+_TASK_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(sorted(_TASK_KEYWORDS, key=len, reverse=True)) + "))"
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _analyze_task(task: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """Detect (language, complexity, features) for a task; cached per task string."""
+    found = frozenset(_TASK_KEYWORD_RE.findall(task.lower()))
+    
+    # Detect programming language
+    language = "python"  # default
+    if found & _JAVASCRIPT_WORDS:
+        language = "javascript"
+    elif "java" in found:
+        language = "java"
+    elif found & _PYTHON_WORDS:
+        language = "python"
+    
+    # Detect project complexity
+    complexity = "simple"
+    if found & _WEB_WORDS:
+        complexity = "web"
+    elif found & _CLI_WORDS:
+        complexity = "cli"
+    elif found & _LIBRARY_WORDS:
+        complexity = "library"
+    
+    # Detect key features
+    features = []
+    if found & _GUI_WORDS:
+        features.append("gui")
+    if found & _DATABASE_WORDS:
+        features.append("database")
+    if found & _API_WORDS:
+        features.append("api")
+    if "test" in found:
+        features.append("testing")
+    
+    return language, complexity, tuple(features)
+
+
+def _write_text(path: Path, content: str, mode: Optional[int] = None):
+    """Write a UTF-8 text file and optionally set its permission bits."""
+    if mode is None:
+        path.write_text(content, encoding="utf-8")
+        return
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
     try:
-        from opencode_ai import AsyncOpencode
-        from opencode_ai.types import TextPartInputParam, FilePartInputParam
-    except ImportError:
-        # Fallback to local OpenCode SDK
-        import sys
-        sys.path.insert(0, '/Users/Mark/Software/autonomous-coding_Hello_World/opencode-sdk-python/src')
-        from opencode_ai import AsyncOpencode
-        from opencode_ai.types import TextPartInputParam, FilePartInputParam
+        # An explicit mode must survive the umask and apply to files that already existed
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, mode)
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+async def _write_text_async(path: Path, content: str, mode: Optional[int] = None):
+    """Write (and optionally chmod) a text file from a worker thread so the event loop is not blocked."""
+    await asyncio.to_thread(_write_text, path, content, mode)
+
+
+async def _run_git_batch(project_dir: Path, *commands: Tuple[str, ...],
+                         report_errors: bool = False) -> int:
+    """Run several git commands in one shell process, stopping at the first failure."""
+    if os.name == "nt":
+        # No POSIX shell on Windows; run the commands one by one instead
+        argvs = [("git", *args) for args in commands]
+    else:
+        script = " && ".join(
+            "git " + " ".join(shlex.quote(arg) for arg in args) for args in commands
+        )
+        argvs = [("sh", "-c", script)]
     
-    OPENCODE_SDK_AVAILABLE = True
-    print("✅ OpenCode SDK available")
-except ImportError as e:
-    print(f"ℹ️ OpenCode SDK not available: {e}")
+    # Output is discarded; stderr is piped only when a failure should be reported
+    stderr = asyncio.subprocess.PIPE if report_errors else asyncio.subprocess.DEVNULL
+    for argv in argvs:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=project_dir,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=stderr
+        )
+        _, err = await proc.communicate()
+        if proc.returncode != 0:
+            if report_errors:
+                print(f"⚠️ git failed: {err.decode(errors='replace').strip()}")
+            return proc.returncode
+    return 0
+
+
+# Prebuilt empty repository that simulated projects copy instead of running git init.
+# It lives in a per-user cache directory, never a shared path such as /tmp, because its
+# config and hooks end up in every project and run on the following git commands.
+_GIT_TEMPLATE_ROOT = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "unified_autonomous_generator"
+
+
+def _private_cache_dir() -> Optional[Path]:
+    """Create the per-user cache directory (0700); None unless only the current user can access it."""
+    _GIT_TEMPLATE_ROOT.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = os.lstat(_GIT_TEMPLATE_ROOT)
+    if not stat.S_ISDIR(st.st_mode):
+        return None
+    if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o077):
+        return None
+    return _GIT_TEMPLATE_ROOT
+
+
+@functools.lru_cache(maxsize=None)
+def _prepare_git_template() -> Optional[Path]:
+    """Create the template repository once per user; None if it cannot be created safely."""
+    try:
+        root = _private_cache_dir()
+        if root is None:
+            return None
+        template = root / "git_template"
+        if (template / ".git" / "HEAD").exists():
+            return template
+        staging = Path(tempfile.mkdtemp(prefix="git_template_", dir=root))
+        try:
+            subprocess.run(
+                ["git", "init", "-q", str(staging)],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+            )
+            # Build aside and rename into place so concurrent processes never see a partial template
+            os.rename(staging, template)
+        except (OSError, subprocess.CalledProcessError):
+            shutil.rmtree(staging, ignore_errors=True)
+        return template if (template / ".git" / "HEAD").exists() else None
+    except OSError:
+        return None
+
+
+def _clone_git_template(project_dir: Path) -> bool:
+    """Give project_dir an empty .git copied from the template; False if git init is still needed."""
+    try:
+        template = _prepare_git_template()
+        if template is None:
+            return False
+        # Plain copies, not hardlinks, so editing one project's .git never touches another's
+        shutil.copytree(template / ".git", project_dir / ".git")
+    except OSError:
+        return False
+    return True
+
+
+async def _wait_for_files(paths: List[Path], timeout: float = 2.0, interval: float = 0.05) -> bool:
+    """Poll until all paths exist or the timeout elapses; returns whether they all appeared."""
+    for _ in range(max(1, int(timeout / interval))):
+        if all(path.exists() for path in paths):
+            return True
+        await asyncio.sleep(interval)
+    return all(path.exists() for path in paths)
+
+
+async def _run_python(script: Path, cwd: Path, timeout: float = 30) -> Tuple[int, str]:
+    """Run a Python script without blocking the event loop; returns (returncode, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        "python3", str(script),
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        _, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stderr.decode(errors="replace")
+
+
+def _run_python_in_process(script: Path) -> Tuple[int, str]:
+    """Run a trusted generated script as __main__ in this interpreter; returns (returncode, stderr)."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            runpy.run_path(str(script), run_name="__main__")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0, stderr.getvalue()
+        return 1, stderr.getvalue() + str(e.code)
+    except Exception:
+        return 1, stderr.getvalue() + traceback.format_exc()
+    return 0, stderr.getvalue()
+
+
+def _dump_features(features: List[Dict]) -> bytes:
+    """Serialize a feature list as indented UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(features, option=orjson.OPT_INDENT_2)
+    return json.dumps(features, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# OpenCode client shared by generations on the same event loop, so they reuse its
+# connection pool; it is closed on that loop when the loop shuts down
+_SHARED_OPENCODE_CLIENT = LoopScopedResource(
+    lambda: _load_opencode_sdk().AsyncOpencode(),
+    lambda client: client.close()
+)
+
+
+# Instruction files above this size are read through mmap instead of a buffered read
+_MMAP_READ_THRESHOLD = 4096
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 text file (instruction files), memory-mapping it when it is larger than a page."""
+    if path.stat().st_size <= _MMAP_READ_THRESHOLD:
+        return path.read_text(encoding="utf-8")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return str(mapped, "utf-8")
+
+
+# API key environment variable per OpenCode provider
+_PROVIDER_ENV_MAP = MappingProxyType({
+    "anthropic": "ANTHROPIC_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "openai-gpt": "OPENAI_API_KEY",
+    "azure": "AZURE_OPENAI_API_KEY"
+})
+
+
+# MIME type per attachment suffix (read-only); anything else is sent as text/plain
+_MIME_BY_SUFFIX = MappingProxyType({
+    ".json": "application/json",
+    ".md": "text/markdown",
+    ".py": "text/x-python",
+    ".txt": "text/plain"
+})
+
+
+# Base file count per project complexity (read-only)
+_BASE_FILE_COUNT = MappingProxyType({"simple": 1, "cli": 2, "library": 3, "web": 5})
+
+# Feature lists keyed on (language, complexity, features, description)
+_FEATURE_LIST_CACHE: Dict[Tuple, List[Dict]] = {}
+_FEATURE_LIST_CACHE_SIZE = 128
 
 
 class BaseAutonomousGenerator(ABC):
@@ -78,57 +622,65 @@ class BaseAutonomousGenerator(ABC):
     Defines the common interface and shared functionality.
     """
     
-    def __init__(self, enable_simulation: bool = False):
+    def __init__(self, enable_simulation: bool = False, in_process: bool = False):
         self.enable_simulation = enable_simulation
+        # Opt-in: run generated programs in this interpreter instead of a python3 subprocess
+        self.in_process = in_process
     
     def parse_task_description(self, task: str) -> Dict:
         """Parse and analyze the task description to determine project requirements."""
-        task_lower = task.lower()
-        
-        # Detect programming language
-        language = "python"  # default
-        if any(word in task_lower for word in ["javascript", "js", "node"]):
-            language = "javascript"
-        elif "java" in task_lower and "javascript" not in task_lower:
-            language = "java"
-        elif any(word in task_lower for word in ["python", "py"]):
-            language = "python"
-        
-        # Detect project complexity
-        complexity = "simple"
-        if any(word in task_lower for word in ["web", "app", "website", "server", "api"]):
-            complexity = "web"
-        elif any(word in task_lower for word in ["cli", "command", "tool", "utility"]):
-            complexity = "cli"
-        elif any(word in task_lower for word in ["library", "package", "module"]):
-            complexity = "library"
-        
-        # Detect key features
-        features = []
-        if any(word in task_lower for word in ["gui", "interface", "window"]):
-            features.append("gui")
-        if any(word in task_lower for word in ["database", "db", "sql"]):
-            features.append("database")
-        if any(word in task_lower for word in ["api", "rest", "endpoint"]):
-            features.append("api")
-        if "test" in task_lower:
-            features.append("testing")
+        language, complexity, features = _analyze_task(task)
         
         return {
             "language": language,
             "complexity": complexity,
-            "features": features,
+            "features": list(features),
             "description": task,
             "estimated_files": self._estimate_file_count(complexity, features)
         }
     
     def _estimate_file_count(self, complexity: str, features: List[str]) -> int:
         """Estimate number of files based on project complexity."""
-        base_count = {"simple": 1, "cli": 2, "library": 3, "web": 5}
-        return base_count.get(complexity, 1) + len(features)
+        return _BASE_FILE_COUNT.get(complexity, 1) + len(features)
+    
+    async def _run_generated_program(self, main_file: Path, project_dir: Path) -> Tuple[int, str]:
+        """Run a generated Python program; returns (returncode, stderr)."""
+        if self.in_process:
+            # Skips interpreter startup, but has no timeout, runs in the caller's working
+            # directory and captures process-wide stdout/stderr while it runs
+            return _run_python_in_process(main_file)
+        return await _run_python(main_file, project_dir, timeout=30)
     
     def create_comprehensive_feature_list(self, task_analysis: Dict) -> List[Dict]:
-        """Create detailed feature list following Anthropic research approach."""
+        """Create detailed feature list following Anthropic research approach (memoized)."""
+        # Callers flip "passes" on the result, so each gets a private copy
+        return copy.deepcopy(self._cached_feature_list(task_analysis))
+    
+    def create_feature_status_list(self, task_analysis: Dict, success: bool) -> List[Dict]:
+        """Build the final feature list with "passes" set: high priority follows success, the rest pass."""
+        return [
+            {**feature, "passes": success if feature["priority"] == "high" else True}
+            for feature in self._cached_feature_list(task_analysis)
+        ]
+    
+    def _cached_feature_list(self, task_analysis: Dict) -> List[Dict]:
+        """Return the shared memoized feature list; callers must not mutate it."""
+        key = (
+            task_analysis["language"],
+            task_analysis["complexity"],
+            tuple(task_analysis.get("features", [])),
+            task_analysis["description"]
+        )
+        cached = _FEATURE_LIST_CACHE.get(key)
+        if cached is None:
+            if len(_FEATURE_LIST_CACHE) >= _FEATURE_LIST_CACHE_SIZE:
+                _FEATURE_LIST_CACHE.pop(next(iter(_FEATURE_LIST_CACHE)))
+            cached = self._build_feature_list(task_analysis)
+            _FEATURE_LIST_CACHE[key] = cached
+        return cached
+    
+    def _build_feature_list(self, task_analysis: Dict) -> List[Dict]:
+        """Build the feature list for a task analysis."""
         language = task_analysis["language"]
         complexity = task_analysis["complexity"]
         description = task_analysis["description"]
@@ -347,15 +899,14 @@ class BaseAutonomousGenerator(ABC):
             print(f"   Complexity: {task_analysis['complexity']}")
             print(f"   Features: {task_analysis['features']}")
             
-            # Set up project directory
-            project_dir = self.setup_project_directory(location, project_name)
+            # Set up project directory; all mkdir calls run in one worker thread
+            project_dir = await asyncio.to_thread(self.setup_project_directory, location, project_name)
             print(f"\\n📁 Project Directory: {project_dir}")
             
             # Create feature list
             features = self.create_comprehensive_feature_list(task_analysis)
             feature_file = project_dir / "feature_list.json"
-            with open(feature_file, "w") as f:
-                json.dump(features, f, indent=2)
+            feature_file.write_bytes(_dump_features(features))
             print(f"✅ Created feature list with {len(features)} features")
             
             # Run framework-specific autonomous generation
@@ -374,149 +925,53 @@ class ClaudeAutonomousGenerator(BaseAutonomousGenerator):
     Implements the Anthropic research two-agent pattern with Claude Code SDK.
     """
     
-    def __init__(self, model: str = "claude-sonnet-4-5-20250929", enable_simulation: bool = False):
-        super().__init__(enable_simulation)
+    def __init__(self, model: str = "claude-sonnet-4-5-20250929", enable_simulation: bool = False,
+                 in_process: bool = False):
+        super().__init__(enable_simulation, in_process)
         self.model = model
         self.api_key = os.environ.get("ANTHROPIC_API_KEY")
         self.use_claude_sdk = self.api_key is not None
-        
-        if not CLAUDE_SDK_AVAILABLE:
-            raise ImportError("Claude SDK not available. Install with: pip install claude-code-sdk")
-        
-        # Check for API key when simulation is disabled
-        if not self.enable_simulation and not self.api_key:
-            raise ValueError(
-                "❌ ANTHROPIC_API_KEY required for Claude autonomous generation\\n"
-                "   Set environment variable: ANTHROPIC_API_KEY\\n"
-                "   Or use --enable-simulation flag to run without API keys\\n"
-                "   Example: export ANTHROPIC_API_KEY='your-api-key-here'"
-            )
-    
-    def get_framework_name(self) -> str:
-        return "Claude Code SDK"
-    
-    def create_initializer_prompt(self, task_analysis: Dict, project_dir: Path) -> str:
-        """Create initializer agent prompt for Claude SDK."""
-        language = task_analysis["language"]
-        complexity = task_analysis["complexity"]
-        description = task_analysis["description"]
-        
-        return f"""## INITIALIZER AGENT: Claude SDK Project Setup
-
-You are an expert {language} developer using Claude Code SDK for autonomous development.
-
-### PROJECT DESCRIPTION:
-{description}
-
-### PROJECT ANALYSIS:
-- **Language**: {language}
-- **Complexity**: {complexity}
-- **Working Directory**: {project_dir}
-- **Framework**: Claude Code SDK
-
-### YOUR TASKS AS INITIALIZER AGENT:
-
-1. **EXAMINE PROJECT STRUCTURE**:
-   - The project directory has been created with src/, tests/, docs/ subdirectories
-   - Read feature_list.json to understand requirements
-   - Plan the implementation approach
-
-2. **CREATE PROJECT FOUNDATION**:
-   - Create README.md with comprehensive project documentation
-   - Set up main program files in src/ directory
-   - Create init.sh script for environment setup
-   - Initialize git repository with initial commit
-
-3. **PLAN IMPLEMENTATION STRATEGY**:
-   - Analyze the feature list requirements
-   - Plan file structure and dependencies
-   - Document the development approach
-   - Create progress tracking file (claude-progress.txt)
-
-4. **PREPARE FOR CODING AGENT**:
-   - Leave clear instructions for implementation
-   - Set up foundation without implementing core logic
-   - Create templates and structure for coding agent
-   - Document what needs to be implemented
-
-### CLAUDE SDK INTEGRATION:
-- Use MCP tools for file operations and testing
-- Leverage Claude's code generation capabilities
-- Follow security best practices with command allowlists
-
-### IMPORTANT:
-- Focus on PROJECT SETUP and PLANNING only
-- Do NOT implement the actual functionality yet
-- Create solid foundation for incremental development
-- Leave detailed instructions for the coding agent
-
-Start by reading feature_list.json to understand the full requirements.
-"""
+        
+        if _load_claude_client() is None:
+            raise ImportError("Claude SDK not available. Install with: pip install claude-code-sdk")
+        
+        # Check for API key when simulation is disabled
+        if not self.enable_simulation and not self.api_key:
+            raise ValueError(
+                "❌ ANTHROPIC_API_KEY required for Claude autonomous generation\\n"
+                "   Set environment variable: ANTHROPIC_API_KEY\\n"
+                "   Or use --enable-simulation flag to run without API keys\\n"
+                "   Example: export ANTHROPIC_API_KEY='your-api-key-here'"
+            )
+    
+    def get_framework_name(self) -> str:
+        return "Claude Code SDK"
+    
+    def create_initializer_prompt(self, task_analysis: Dict, project_dir: Path) -> str:
+        """Create initializer agent prompt for Claude SDK."""
+        # Static preamble first so repeated runs share a cacheable prompt prefix
+        return _CLAUDE_INITIALIZER_PREAMBLE + self._initializer_context(task_analysis, project_dir)
+    
+    def _initializer_context(self, task_analysis: Dict, project_dir: Path) -> str:
+        """Task-specific tail of the initializer prompt."""
+        return _CLAUDE_INITIALIZER_CONTEXT.format_map({
+            "description": task_analysis["description"],
+            "language": task_analysis["language"],
+            "complexity": task_analysis["complexity"],
+            "project_dir": project_dir
+        })
     
     def create_coding_prompt(self, task_analysis: Dict, project_dir: Path) -> str:
         """Create coding agent prompt for Claude SDK."""
-        language = task_analysis["language"]
-        description = task_analysis["description"]
-        
-        return f"""## CODING AGENT: Claude SDK Incremental Development
-
-You are an expert {language} developer continuing autonomous development with Claude Code SDK.
-
-### PROJECT DESCRIPTION:
-{description}
-
-### YOUR WORKING DIRECTORY:
-{project_dir}
-
-### STEP-BY-STEP PROCESS (CRITICAL):
-
-1. **GET YOUR BEARINGS**:
-   - Run `pwd` to see your current directory
-   - Read claude-progress.txt to understand previous work
-   - Check git log to see what has been done: `git log --oneline -10`
-
-2. **READ REQUIREMENTS**:
-   - Read feature_list.json to see all features
-   - Find the HIGHEST PRIORITY feature that has "passes": false
-   - Focus on implementing ONE feature at a time
-
-3. **UNDERSTAND PROJECT STRUCTURE**:
-   - Examine existing files and project layout
-   - Read README.md for project documentation
-   - Run init.sh if it exists to set up environment
-
-4. **IMPLEMENT THE CHOSEN FEATURE**:
-   - Work on only ONE feature per session
-   - Follow the detailed steps in the feature definition
-   - Write clean, well-documented {language} code
-   - Use Claude's advanced reasoning for complex logic
-
-5. **TEST YOUR IMPLEMENTATION**:
-   - Use available MCP tools to test the program
-   - Verify all steps listed in the feature requirements
-   - Fix any bugs or issues found
-   - Only mark feature as "passes": true when fully working
-
-6. **CLEAN UP AND DOCUMENT**:
-   - Ensure code is clean and well-commented
-   - Update feature_list.json to mark completed features
-   - Commit changes with descriptive git message
-   - Update claude-progress.txt with accomplishments
-
-### CLAUDE SDK CAPABILITIES:
-- Advanced code reasoning and generation
-- MCP tool integration for file operations
-- Security-conscious development practices
-- Context management across sessions
-
-### CRITICAL RULES:
-- **ONE FEATURE AT A TIME**: Never implement multiple features simultaneously
-- **THOROUGH TESTING**: Test everything before marking complete
-- **CLEAN STATE**: Leave working, documented code
-- **INCREMENTAL**: Make steady, verifiable progress
-
-Begin by reading claude-progress.txt and feature_list.json to understand current state.
-"""
+        return _CLAUDE_CODING_PREAMBLE + self._coding_context(task_analysis, project_dir)
+    
+    def _coding_context(self, task_analysis: Dict, project_dir: Path) -> str:
+        """Task-specific tail of the coding prompt."""
+        return _CLAUDE_CODING_CONTEXT.format_map({
+            "description": task_analysis["description"],
+            "language": task_analysis["language"],
+            "project_dir": project_dir
+        })
     
     async def run_autonomous_generation(self, task_analysis: Dict, project_dir: Path) -> bool:
         """Run autonomous generation using Claude SDK."""
@@ -525,27 +980,21 @@ Begin by reading claude-progress.txt and feature_list.json to understand current
                 print("🤖 Using Claude Code SDK for real autonomous generation...")
                 
                 # Create Claude client
-                client = create_claude_client(str(project_dir))
-                
-                # Run initializer agent
-                print("\\n🔧 Running Claude Initializer Agent...")
-                init_prompt = self.create_initializer_prompt(task_analysis, project_dir)
+                client = _load_claude_client()(project_dir, self.model)
                 
+                # One connected session serves both agents
                 async with client:
+                    # Run initializer agent
+                    print("\\n🔧 Running Claude Initializer Agent...")
+                    init_prompt = self.create_initializer_prompt(task_analysis, project_dir)
                     await client.query(init_prompt)
-                    # Process Claude's responses here
-                    async for msg in client.receive_response():
-                        pass  # Handle Claude responses
-                
-                # Run coding agent
-                print("\\n💻 Running Claude Coding Agent...")
-                coding_prompt = self.create_coding_prompt(task_analysis, project_dir)
-                
-                async with client:
+                    self._check_agent_result("Initializer", await self._drain_response(client))
+                    
+                    # Run coding agent
+                    print("\\n💻 Running Claude Coding Agent...")
+                    coding_prompt = self.create_coding_prompt(task_analysis, project_dir)
                     await client.query(coding_prompt)
-                    # Process Claude's responses here
-                    async for msg in client.receive_response():
-                        pass  # Handle Claude responses
+                    self._check_agent_result("Coding", await self._drain_response(client))
                 
                 print("✅ Claude SDK generation completed")
                 return True
@@ -566,10 +1015,57 @@ Begin by reading claude-progress.txt and feature_list.json to understand current
                 print("💡 Tip: Use --enable-simulation flag to run without API access")
                 raise Exception(f"Claude SDK failed and simulation disabled: {e}")
     
+    async def _drain_response(self, client) -> Any:
+        """
+        Consume an agent response stream and return only its final message.
+        
+        The stream is read to the end rather than closed early: the agent keeps
+        working (editing files, running tools) until it emits its result.
+        """
+        last_message = None
+        async for msg in client.receive_response():
+            last_message = msg
+        return last_message
+    
+    def _check_agent_result(self, agent_name: str, result: Any):
+        """Raise if the agent's final result message reports an error."""
+        if getattr(result, "is_error", False):
+            raise RuntimeError(f"{agent_name} agent reported an error: {getattr(result, 'result', None)}")
+    
     async def _simulate_claude_generation(self, task_analysis: Dict, project_dir: Path) -> bool:
         """Simulate Claude SDK generation."""
         print("🔧 Running Claude SDK simulation...")
         
+        # Initializer scaffolding and the main program touch disjoint files,
+        # so the two agents' first steps run concurrently
+        await asyncio.gather(
+            self._write_claude_scaffold(task_analysis, project_dir),
+            self._create_program_claude(task_analysis, project_dir)
+        )
+        
+        # Test program
+        success = await self._test_program_claude(task_analysis, project_dir)
+        
+        # Update features
+        features = self.create_feature_status_list(task_analysis, success)
+        
+        # feature_list.json is the source of truth for progress, so it is written synchronously
+        feature_file = project_dir / "feature_list.json"
+        feature_file.write_bytes(_dump_features(features))
+        
+        # Final commit
+        await _run_git_batch(
+            project_dir,
+            ("add", "."),
+            ("commit", "-q", "-m", "Implemented core functionality with Claude SDK"),
+            report_errors=True
+        )
+        
+        print("✅ Claude SDK coding agent completed")
+        return success
+    
+    async def _write_claude_scaffold(self, task_analysis: Dict, project_dir: Path):
+        """Write initializer agent files and make the initial commit."""
         language = task_analysis["language"]
         description = task_analysis["description"]
         complexity = task_analysis["complexity"]
@@ -612,9 +1108,6 @@ This project follows Anthropic's research principles:
 - Security best practices
 """
         
-        with open(project_dir / "README.md", "w") as f:
-            f.write(readme_content)
-        
         # Create init script
         if language == "python":
             init_script = """#!/bin/bash
@@ -643,10 +1136,6 @@ echo "Generated by Claude Code SDK autonomous framework"
 echo "Environment ready!"
 """
         
-        with open(project_dir / "init.sh", "w") as f:
-            f.write(init_script)
-        os.chmod(project_dir / "init.sh", 0o755)
-        
         # Create progress file
         progress_content = f"""# Claude SDK Progress Log
 Project: {project_dir.name}
@@ -672,117 +1161,43 @@ Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Next: Begin implementing features from feature_list.json incrementally.
 """
         
-        with open(project_dir / "claude-progress.txt", "w") as f:
-            f.write(progress_content)
-        
-        # Initialize git
-        subprocess.run(["git", "init"], cwd=project_dir, capture_output=True)
-        subprocess.run(["git", "add", "."], cwd=project_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial setup by Claude SDK autonomous agent"],
-            cwd=project_dir, capture_output=True
+        # The three files are independent, so write them concurrently
+        await asyncio.gather(
+            _write_text_async(project_dir / "README.md", readme_content),
+            _write_text_async(project_dir / "init.sh", init_script, mode=0o755),
+            _write_text_async(project_dir / "claude-progress.txt", progress_content)
         )
         
-        print("✅ Initializer agent setup completed")
-        
-        # Create main program
-        await self._create_program_claude(task_analysis, project_dir)
-        
-        # Test program
-        success = await self._test_program_claude(task_analysis, project_dir)
-        
-        # Update features
-        features = self.create_comprehensive_feature_list(task_analysis)
-        for feature in features:
-            feature["passes"] = success if feature["priority"] == "high" else True
-        
-        feature_file = project_dir / "feature_list.json"
-        with open(feature_file, "w") as f:
-            json.dump(features, f, indent=2)
-        
-        # Final commit
-        subprocess.run(["git", "add", "."], cwd=project_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Implemented core functionality with Claude SDK"],
-            cwd=project_dir, capture_output=True
+        # Initialize git; stage only the initializer's files since the
+        # coding agent may be writing src/ at the same time
+        initial_files = [
+            name for name in _CLAUDE_SCAFFOLD_FILES if (project_dir / name).exists()
+        ]
+        git_init = () if await asyncio.to_thread(_clone_git_template, project_dir) else (("init", "-q"),)
+        await _run_git_batch(
+            project_dir,
+            *git_init,
+            ("add", *initial_files),
+            ("commit", "-q", "-m", "Initial setup by Claude SDK autonomous agent")
         )
         
-        print("✅ Claude SDK coding agent completed")
-        return success
+        print("✅ Initializer agent setup completed")
     
     async def _create_program_claude(self, task_analysis: Dict, project_dir: Path):
         """Create program using Claude SDK patterns."""
         description = task_analysis["description"]
         language = task_analysis["language"]
         
-        if language == "python":
-            if "hello world" in description.lower():
-                content = '''#!/usr/bin/env python3
-"""
-Hello World Program - Generated by Claude SDK
-============================================
-
-A sophisticated Hello World implementation showcasing
-Claude Code SDK autonomous generation capabilities.
-
-Usage:
-    python3 main.py
-"""
-
-def main():
-    """
-    Main function demonstrating Claude SDK code generation.
-    
-    This function showcases the advanced reasoning capabilities
-    of Claude Code SDK for autonomous development.
-    """
-    print("Hello World")
-    print("Generated by Claude Code SDK Autonomous Agent!")
-    print("Powered by Anthropic's advanced reasoning")
-    
-def demonstrate_claude_capabilities():
-    """Showcase Claude SDK framework features."""
-    print("\\n=== Claude Code SDK Features ===")
-    print("✅ Advanced AI reasoning")
-    print("✅ MCP tool integration") 
-    print("✅ Security-conscious development")
-    print("✅ Context-aware code generation")
-    print("✅ Autonomous development workflows")
-
-if __name__ == "__main__":
-    main()
-    demonstrate_claude_capabilities()
-'''
-            else:
-                content = f'''#!/usr/bin/env python3
-"""
-{description} - Generated by Claude SDK
-{"=" * (len(description) + 25)}
-
-Advanced implementation using Claude Code SDK autonomous generation.
-
-Usage:
-    python3 main.py
-"""
-
-def main():
-    """Main program logic - Claude SDK generated."""
-    print("Claude Code SDK Autonomous Generation")
-    print("=" * 35)
-    print(f"Task: {description}")
-    print("Framework: Claude Code SDK")
-    print("Generated with advanced AI reasoning!")
-    return True
-
-if __name__ == "__main__":
-    main()
-'''
-        else:
-            content = f"# {description}\\n# Generated by Claude Code SDK\\nprint('Claude SDK - {language} program')"
+        variant = "hello" if "hello world" in description.lower() else "default"
+        template = _CLAUDE_PROGRAM_TEMPLATES.get((language, variant), _CLAUDE_FALLBACK_TEMPLATE)
+        content = template.format(
+            description=description,
+            language=language,
+            underline="=" * (len(description) + 25)
+        )
         
         main_file = project_dir / "src" / f"main.{('py' if language == 'python' else 'txt')}"
-        with open(main_file, "w") as f:
-            f.write(content)
+        await _write_text_async(main_file, content)
         
         print(f"✅ Created Claude SDK {language} program: {main_file}")
     
@@ -794,19 +1209,13 @@ if __name__ == "__main__":
             if language == "python":
                 main_file = project_dir / "src" / "main.py"
                 if main_file.exists():
-                    result = subprocess.run(
-                        ["python3", str(main_file)],
-                        capture_output=True,
-                        text=True,
-                        cwd=project_dir,
-                        timeout=30
-                    )
+                    returncode, stderr = await self._run_generated_program(main_file, project_dir)
                     
-                    if result.returncode == 0:
+                    if returncode == 0:
                         print(f"✅ Claude SDK program executed successfully")
                         return True
                     else:
-                        print(f"❌ Claude SDK program failed: {result.stderr}")
+                        print(f"❌ Claude SDK program failed: {stderr}")
                         return False
             
             return True
@@ -822,14 +1231,21 @@ class OpenCodeAutonomousGenerator(BaseAutonomousGenerator):
     """
     
     def __init__(self, provider_id: str = "anthropic", model_id: str = "claude-3.5-sonnet",
-                 enable_simulation: bool = False):
-        super().__init__(enable_simulation)
+                 enable_simulation: bool = False, in_process: bool = False):
+        super().__init__(enable_simulation, in_process)
         self.provider_id = provider_id
+        # Canonical lowercase provider name for lookups
+        self._provider_key = provider_id.lower()
         self.model_id = model_id
         self.client = None
         self.session_id = None
+        # provider_id is fixed for the generator's lifetime, so resolve its key variable once;
+        # other providers are assumed to follow the generic <PROVIDER>_API_KEY pattern
+        self._api_key_env_var = _PROVIDER_ENV_MAP.get(
+            self._provider_key, f"{provider_id.upper()}_API_KEY"
+        )
         
-        if not OPENCODE_SDK_AVAILABLE:
+        if _load_opencode_sdk() is None:
             raise ImportError("OpenCode SDK not available. Install with: pip install --pre opencode-ai")
         
         # Check for required API keys when simulation is disabled
@@ -838,21 +1254,8 @@ class OpenCodeAutonomousGenerator(BaseAutonomousGenerator):
     
     def _verify_api_keys(self):
         """Verify that required API keys are available for the selected provider."""
-        required_key = None
-        
-        if self.provider_id.lower() == "anthropic":
-            required_key = os.environ.get("ANTHROPIC_API_KEY")
-            env_var = "ANTHROPIC_API_KEY"
-        elif self.provider_id.lower() in ["openai", "openai-gpt"]:
-            required_key = os.environ.get("OPENAI_API_KEY")
-            env_var = "OPENAI_API_KEY"
-        elif self.provider_id.lower() == "azure":
-            required_key = os.environ.get("AZURE_OPENAI_API_KEY")
-            env_var = "AZURE_OPENAI_API_KEY"
-        else:
-            # For other providers, assume generic API key pattern
-            env_var = f"{self.provider_id.upper()}_API_KEY"
-            required_key = os.environ.get(env_var)
+        env_var = self._api_key_env_var
+        required_key = os.environ.get(env_var)
         
         if not required_key:
             raise ValueError(
@@ -867,7 +1270,7 @@ class OpenCodeAutonomousGenerator(BaseAutonomousGenerator):
     
     async def initialize_session(self) -> str:
         """Initialize OpenCode session for autonomous generation."""
-        self.client = AsyncOpencode()
+        self.client = await _SHARED_OPENCODE_CLIENT.get()
         
         # Create new session
         session = await self.client.session.create()
@@ -883,26 +1286,22 @@ class OpenCodeAutonomousGenerator(BaseAutonomousGenerator):
             "text": text
         }
     
-    def create_file_part(self, file_path: str, content: str) -> dict:
-        """Create a file part for OpenCode messages."""
+    def create_file_part(self, file_path: Path) -> dict:
+        """Create a file part for OpenCode messages (a reference by URL; contents are not inlined)."""
         return {
             "type": "file", 
-            "url": f"file://{file_path}",
-            "mime": "text/plain",
-            "filename": Path(file_path).name
+            "url": f"file://{file_path.as_posix()}",
+            "mime": _MIME_BY_SUFFIX.get(file_path.suffix, "text/plain"),
+            "filename": file_path.name
         }
     
     async def send_message_with_files(self, prompt: str, file_paths: List[Path] = None) -> Any:
         """Send message to OpenCode with optional file attachments."""
         parts = [self.create_text_part(prompt)]
         
-        # Add file parts if provided
+        # Add file parts for the attachments that exist; parts only reference the file
         if file_paths:
-            for file_path in file_paths:
-                if file_path.exists():
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    parts.append(self.create_file_part(str(file_path), content))
+            parts.extend(self.create_file_part(file_path) for file_path in file_paths if file_path.exists())
         
         # Send message to OpenCode
         response = await self.client.session.chat(
@@ -921,69 +1320,13 @@ class OpenCodeAutonomousGenerator(BaseAutonomousGenerator):
     
     def create_opencode_prompt(self, task_analysis: Dict, project_dir: Path, agent_type: str) -> str:
         """Create OpenCode-specific prompts for autonomous generation."""
-        language = task_analysis["language"]
-        description = task_analysis["description"]
-        
-        if agent_type == "initializer":
-            return f"""## INITIALIZER AGENT: OpenCode Project Setup
-
-You are an expert {language} developer using OpenCode SDK for autonomous development.
-
-### PROJECT DESCRIPTION:
-{description}
-
-### FRAMEWORK: OpenCode SDK
-- Multi-provider AI support ({self.provider_id}/{self.model_id})
-- Session-based development workflow
-- Native file handling capabilities
-- Built-in development tools integration
-
-### YOUR TASKS AS INITIALIZER AGENT:
-
-1. **PROJECT SETUP**:
-   - Create comprehensive README.md with project documentation
-   - Set up init.sh script for environment configuration
-   - Initialize git repository with proper structure
-   - Create progress tracking file (claude-progress.txt)
-
-2. **FOUNDATION BUILDING**:
-   - Analyze feature_list.json requirements
-   - Plan implementation strategy
-   - Set up development environment
-   - Prepare for coding agent
-
-### OPENCODE INTEGRATION:
-- Use built-in terminal and editor tools
-- Leverage session-based development workflow
-- Utilize native file operations
-- Support multiple AI providers
-
-Focus on PROJECT SETUP only. Leave implementation for the coding agent.
-"""
-        else:  # coding agent
-            return f"""## CODING AGENT: OpenCode Incremental Development
-
-You are an expert {language} developer using OpenCode SDK for autonomous implementation.
-
-### PROJECT DESCRIPTION:
-{description}
-
-### OPENCODE SESSION WORKFLOW:
-
-1. **GET BEARINGS**: Read claude-progress.txt and feature_list.json
-2. **SELECT FEATURE**: Choose ONE high-priority feature that's not complete
-3. **IMPLEMENT**: Write clean, tested {language} code
-4. **VALIDATE**: Test thoroughly before marking complete
-5. **DOCUMENT**: Update progress and commit changes
-
-### OPENCODE CAPABILITIES:
-- Multi-provider AI reasoning ({self.provider_id}/{self.model_id})
-- Built-in development tools
-- Session-based context management
-- Native file operations
-
-Work on ONE feature at a time. Test everything. Maintain clean state.
-"""
+        template = _OPENCODE_INITIALIZER_TEMPLATE if agent_type == "initializer" else _OPENCODE_CODING_TEMPLATE
+        return template.format_map({
+            "language": task_analysis["language"],
+            "description": task_analysis["description"],
+            "provider_id": self.provider_id,
+            "model_id": self.model_id
+        })
     
     async def run_autonomous_generation(self, task_analysis: Dict, project_dir: Path) -> bool:
         """Run autonomous generation using OpenCode SDK."""
@@ -1009,8 +1352,8 @@ Work on ONE feature at a time. Test everything. Maintain clean state.
                 
                 print(f"✅ Initializer agent completed")
                 
-                # Wait for operations to complete
-                await asyncio.sleep(2)
+                # Wait (up to 2s) for the initializer's files to land
+                await _wait_for_files([feature_file, project_dir / "README.md"])
                 
                 # Run coding agent
                 print("\\n💻 Running OpenCode Coding Agent...")
@@ -1051,7 +1394,7 @@ Work on ONE feature at a time. Test everything. Maintain clean state.
             else:
                 raise
         finally:
-            # Clean up session
+            # Clean up session; the shared client stays open for later runs
             if self.client and self.session_id:
                 try:
                     await self.client.session.delete(self.session_id)
@@ -1105,9 +1448,6 @@ This project follows the two-agent pattern with OpenCode enhancements:
 - Simplified architecture
 """
         
-        with open(project_dir / "README.md", "w") as f:
-            f.write(readme_content)
-        
         # Create init script
         if language == "python":
             init_script = f"""#!/bin/bash
@@ -1138,10 +1478,6 @@ echo "Provider: {self.provider_id} | Model: {self.model_id}"
 echo "Environment ready!"
 """
         
-        with open(project_dir / "init.sh", "w") as f:
-            f.write(init_script)
-        os.chmod(project_dir / "init.sh", 0o755)
-        
         # Create progress file
         progress_content = f"""# OpenCode SDK Progress Log
 Project: {project_dir.name}
@@ -1170,15 +1506,19 @@ Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Next: Begin implementing features from feature_list.json incrementally.
 """
         
-        with open(project_dir / "claude-progress.txt", "w") as f:
-            f.write(progress_content)
+        await asyncio.gather(
+            _write_text_async(project_dir / "README.md", readme_content),
+            _write_text_async(project_dir / "init.sh", init_script, mode=0o755),
+            _write_text_async(project_dir / "claude-progress.txt", progress_content)
+        )
         
         # Initialize git
-        subprocess.run(["git", "init"], cwd=project_dir, capture_output=True)
-        subprocess.run(["git", "add", "."], cwd=project_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", f"Initial setup by OpenCode SDK ({self.provider_id})"],
-            cwd=project_dir, capture_output=True
+        git_init = () if await asyncio.to_thread(_clone_git_template, project_dir) else (("init", "-q"),)
+        await _run_git_batch(
+            project_dir,
+            *git_init,
+            ("add", "."),
+            ("commit", "-q", "-m", f"Initial setup by OpenCode SDK ({self.provider_id})")
         )
         
         print("✅ Initializer agent setup completed")
@@ -1190,19 +1530,17 @@ Next: Begin implementing features from feature_list.json incrementally.
         success = await self._test_program_opencode(task_analysis, project_dir)
         
         # Update features
-        features = self.create_comprehensive_feature_list(task_analysis)
-        for feature in features:
-            feature["passes"] = success if feature["priority"] == "high" else True
+        features = self.create_feature_status_list(task_analysis, success)
         
         feature_file = project_dir / "feature_list.json"
-        with open(feature_file, "w") as f:
-            json.dump(features, f, indent=2)
+        await asyncio.to_thread(feature_file.write_bytes, _dump_features(features))
         
         # Final commit
-        subprocess.run(["git", "add", "."], cwd=project_dir, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", f"Implemented core functionality with OpenCode ({self.provider_id})"],
-            cwd=project_dir, capture_output=True
+        await _run_git_batch(
+            project_dir,
+            ("add", "."),
+            ("commit", "-q", "-m", f"Implemented core functionality with OpenCode ({self.provider_id})"),
+            report_errors=True
         )
         
         print("✅ OpenCode coding agent completed")
@@ -1282,8 +1620,7 @@ if __name__ == "__main__":
             content = f"# {description}\\n# Generated by OpenCode SDK\\n# Provider: {self.provider_id}\\nprint('OpenCode SDK - {language} program')"
         
         main_file = project_dir / "src" / f"main.{('py' if language == 'python' else 'txt')}"
-        with open(main_file, "w") as f:
-            f.write(content)
+        await _write_text_async(main_file, content)
         
         print(f"✅ Created OpenCode SDK {language} program: {main_file}")
     
@@ -1295,19 +1632,13 @@ if __name__ == "__main__":
             if language == "python":
                 main_file = project_dir / "src" / "main.py"
                 if main_file.exists():
-                    result = subprocess.run(
-                        ["python3", str(main_file)],
-                        capture_output=True,
-                        text=True,
-                        cwd=project_dir,
-                        timeout=30
-                    )
+                    returncode, stderr = await self._run_generated_program(main_file, project_dir)
                     
-                    if result.returncode == 0:
+                    if returncode == 0:
                         print(f"✅ OpenCode SDK program executed successfully")
                         return True
                     else:
-                        print(f"❌ OpenCode SDK program failed: {result.stderr}")
+                        print(f"❌ OpenCode SDK program failed: {stderr}")
                         return False
             
             return True
@@ -1318,9 +1649,10 @@ if __name__ == "__main__":
 
 def create_generator(framework: str, **kwargs) -> BaseAutonomousGenerator:
     """Factory function to create the appropriate generator based on framework choice."""
+    framework_key = framework.lower()
     
-    if framework.lower() == "claude":
-        if not CLAUDE_SDK_AVAILABLE:
+    if framework_key == "claude":
+        if _load_claude_client() is None:
             raise ImportError(
                 "Claude SDK not available for framework 'claude'\\n"
                 "Install with: pip install claude-code-sdk\\n"
@@ -1328,11 +1660,12 @@ def create_generator(framework: str, **kwargs) -> BaseAutonomousGenerator:
             )
         return ClaudeAutonomousGenerator(
             model=kwargs.get('model', 'claude-sonnet-4-5-20250929'),
-            enable_simulation=kwargs.get('enable_simulation', False)
+            enable_simulation=kwargs.get('enable_simulation', False),
+            in_process=kwargs.get('in_process', False)
         )
     
-    elif framework.lower() == "opencode":
-        if not OPENCODE_SDK_AVAILABLE:
+    elif framework_key == "opencode":
+        if _load_opencode_sdk() is None:
             raise ImportError(
                 "OpenCode SDK not available for framework 'opencode'\\n"
                 "Install with: pip install --pre opencode-ai\\n"
@@ -1341,7 +1674,8 @@ def create_generator(framework: str, **kwargs) -> BaseAutonomousGenerator:
         return OpenCodeAutonomousGenerator(
             provider_id=kwargs.get('provider', 'anthropic'),
             model_id=kwargs.get('model', 'claude-3.5-sonnet'),
-            enable_simulation=kwargs.get('enable_simulation', False)
+            enable_simulation=kwargs.get('enable_simulation', False),
+            in_process=kwargs.get('in_process', False)
         )
     
     else:
@@ -1354,8 +1688,7 @@ def create_generator(framework: str, **kwargs) -> BaseAutonomousGenerator:
 def read_instruction_file(file_path: str) -> str:
     """Read instruction file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
+        content = _read_text(Path(file_path)).strip()
         
         if not content:
             raise ValueError(f"Instruction file {file_path} is empty")
@@ -1367,6 +1700,17 @@ def read_instruction_file(file_path: str) -> str:
         raise Exception(f"Error reading instruction file {file_path}: {e}")
 
 
+def _run_async(coro):
+    """Run coro to completion on a new event loop, using the libuv-based uvloop when installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    # Pass uvloop as the loop factory rather than installing a global event loop policy
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
 def main():
     """Main entry point for the unified autonomous generator."""
     parser = argparse.ArgumentParser(
@@ -1447,6 +1791,12 @@ Examples:
         action="store_true",
         help="Enable simulation mode when API keys are unavailable (default: fail without API)"
     )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Test generated programs in this interpreter instead of a python3 subprocess "
+             "(faster, but no timeout or working-directory isolation)"
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -1479,11 +1829,12 @@ Examples:
             args.framework,
             model=args.model,
             provider=args.provider,
-            enable_simulation=args.enable_simulation
+            enable_simulation=args.enable_simulation,
+            in_process=args.in_process
         )
         
         # Run generation
-        project_dir, success = asyncio.run(
+        project_dir, success = _run_async(
             generator.generate_code(task_description, args.location, args.project)
         )
         
@@ -1516,7 +1867,6 @@ Examples:
     except Exception as e:
         print(f"\\n💥 Unexpected error: {e}")
         if args.verbose:
-            import traceback
             traceback.print_exc()
         return 1
 
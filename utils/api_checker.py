@@ -10,12 +10,14 @@ import asyncio
 import aiohttp
 import os
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import logging
 
+from utils.loop_scoped import LoopScopedResource
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class APIHealthResult:
     """Result of API health check."""
     provider: str
@@ -36,12 +38,91 @@ class APIChecker:
         "azure": None,  # Varies by deployment
     }
     
-    def __init__(self, timeout: float = 10.0):
+    # HTTP method per health endpoint; only the status is read, so HEAD is used where
+    # the endpoint supports it to skip the response body
+    METHOD_BY_PROVIDER = {
+        "openai": "HEAD",
+        "anthropic": "GET"
+    }
+    
+    # Environment variable holding each provider's API key
+    API_KEY_ENV_VARS = {
+        "anthropic": "ANTHROPIC_API_KEY",
+        "openai": "OPENAI_API_KEY",
+        "azure": "AZURE_OPENAI_API_KEY"
+    }
+    
+    def __init__(self, timeout: float = 10.0, cache_ttl: float = 10.0, max_concurrency: int = 10):
         self.timeout = timeout
+        # Bound on in-flight HTTP probes across all callers of this checker
+        self._semaphore = asyncio.Semaphore(max_concurrency)
         self.logger = logging.getLogger(__name__)
+        # Shared session (connection pool + keep-alive), created on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Recent healthy results per provider as (monotonic time, result); failures are never
+        # cached so an outage is re-checked on every call
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, APIHealthResult]] = {}
+        # In-flight probe per provider; concurrent callers await the same task and share
+        # its result, healthy or not
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        # Auth headers and key validity per provider as (api key, value), rebuilt only when
+        # the key in the environment changes
+        self._headers_cache: Dict[str, Tuple[Optional[str], Optional[Dict[str, str]]]] = {}
+        self._key_valid_cache: Dict[str, Tuple[Optional[str], bool]] = {}
+    
+    async def __aenter__(self) -> "APIChecker":
+        self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it if needed."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60, ttl_dns_cache=300)
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _cached_result(self, provider: str) -> Optional[APIHealthResult]:
+        """Return the cached healthy result for provider if it is still fresh."""
+        entry = self._cache.get(provider)
+        if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+            return entry[1]
+        return None
     
     async def check_provider_health(self, provider: str) -> APIHealthResult:
-        """Check health of specific provider."""
+        """Check health of specific provider, reusing a healthy result younger than cache_ttl."""
+        cached = self._cached_result(provider)
+        if cached is not None:
+            return cached
+        
+        task = self._in_flight.get(provider)
+        if task is None:
+            task = asyncio.ensure_future(self._probe_and_cache(provider))
+            self._in_flight[provider] = task
+            task.add_done_callback(lambda done: self._in_flight.pop(provider, None))
+        # shield: one caller being cancelled must not cancel the probe the others await
+        return await asyncio.shield(task)
+    
+    async def _probe_and_cache(self, provider: str) -> APIHealthResult:
+        """Run one probe for provider, caching the result if it is healthy."""
+        result = await self._check_provider_health_uncached(provider)
+        if result.available:
+            self._cache[provider] = (time.monotonic(), result)
+        return result
+    
+    async def _check_provider_health_uncached(self, provider: str) -> APIHealthResult:
+        """Check health of specific provider against its endpoint."""
         start_time = time.time()
         
         try:
@@ -71,22 +152,13 @@ class APIChecker:
                     timestamp=start_time
                 )
             
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                async with session.get(endpoint, headers=headers) as response:
-                    response_time = time.time() - start_time
-                    
-                    # Consider 200-299 and some 4xx as "available" (API is responding)
-                    available = response.status < 500
-                    error_msg = None if available else f"HTTP {response.status}"
-                    
-                    return APIHealthResult(
-                        provider=provider,
-                        available=available,
-                        response_time=response_time,
-                        status_code=response.status,
-                        error_message=error_msg,
-                        timestamp=start_time
-                    )
+            async with self._semaphore:
+                # Per-probe deadline on top of the session timeout, so a stalled connect or
+                # read always ends in the timeout result below
+                return await asyncio.wait_for(
+                    self._probe_endpoint(provider, endpoint, headers, start_time),
+                    timeout=self.timeout + 1
+                )
         
         except asyncio.TimeoutError:
             return APIHealthResult(
@@ -107,17 +179,34 @@ class APIChecker:
                 timestamp=start_time
             )
     
+    async def _probe_endpoint(self, provider: str, endpoint: str,
+                              headers: Dict[str, str], start_time: float) -> APIHealthResult:
+        """Request provider's health endpoint and judge availability from the status."""
+        session = self._get_session()
+        method = self.METHOD_BY_PROVIDER.get(provider, "GET")
+        async with session.request(method, endpoint, headers=headers, allow_redirects=True) as response:
+            response_time = time.time() - start_time
+            # Only the status matters; hand the connection back without reading the body
+            response.release()
+            
+            # Consider 200-299 and some 4xx as "available" (API is responding)
+            available = response.status < 500
+            error_msg = None if available else f"HTTP {response.status}"
+            
+            return APIHealthResult(
+                provider=provider,
+                available=available,
+                response_time=response_time,
+                status_code=response.status,
+                error_message=error_msg,
+                timestamp=start_time
+            )
+    
     async def _check_api_key_validity(self, provider: str) -> APIHealthResult:
         """Check if API key is configured for provider."""
         start_time = time.time()
         
-        env_vars = {
-            "anthropic": "ANTHROPIC_API_KEY",
-            "openai": "OPENAI_API_KEY", 
-            "azure": "AZURE_OPENAI_API_KEY"
-        }
-        
-        env_var = env_vars.get(provider)
+        env_var = self.API_KEY_ENV_VARS.get(provider)
         if not env_var:
             return APIHealthResult(
                 provider=provider,
@@ -129,7 +218,12 @@ class APIChecker:
             )
         
         api_key = os.environ.get(env_var)
-        available = bool(api_key and len(api_key.strip()) > 10)
+        cached = self._key_valid_cache.get(provider)
+        if cached is not None and cached[0] == api_key:
+            available = cached[1]
+        else:
+            available = bool(api_key and len(api_key.strip()) > 10)
+            self._key_valid_cache[provider] = (api_key, available)
         error_msg = None if available else f"No valid {env_var} configured"
         
         return APIHealthResult(
@@ -142,9 +236,24 @@ class APIChecker:
         )
     
     def _get_auth_headers(self, provider: str) -> Optional[Dict[str, str]]:
-        """Get authentication headers for provider."""
+        """Get authentication headers for provider (shared between calls; do not mutate)."""
+        env_var = self.API_KEY_ENV_VARS.get(provider)
+        if not env_var:
+            return None
+        
+        api_key = os.environ.get(env_var)
+        cached = self._headers_cache.get(provider)
+        if cached is not None and cached[0] == api_key:
+            return cached[1]
+        
+        headers = self._build_auth_headers(provider, api_key)
+        self._headers_cache[provider] = (api_key, headers)
+        return headers
+    
+    @staticmethod
+    def _build_auth_headers(provider: str, api_key: Optional[str]) -> Optional[Dict[str, str]]:
+        """Build authentication headers for provider from its API key."""
         if provider == "anthropic":
-            api_key = os.environ.get("ANTHROPIC_API_KEY")
             if api_key:
                 return {
                     "Authorization": f"Bearer {api_key}",
@@ -153,7 +262,6 @@ class APIChecker:
                 }
         
         elif provider == "openai":
-            api_key = os.environ.get("OPENAI_API_KEY")
             if api_key:
                 return {
                     "Authorization": f"Bearer {api_key}",
@@ -161,7 +269,6 @@ class APIChecker:
                 }
         
         elif provider == "azure":
-            api_key = os.environ.get("AZURE_OPENAI_API_KEY")
             if api_key:
                 return {
                     "api-key": api_key,
@@ -170,18 +277,32 @@ class APIChecker:
         
         return None
     
-    async def check_all_providers(self) -> Dict[str, APIHealthResult]:
-        """Check health of all configured providers."""
+    async def check_all_providers(self, max_concurrency: Optional[int] = None) -> Dict[str, APIHealthResult]:
+        """
+        Check health of all configured providers concurrently over the shared session.
+        
+        In-flight probes are always bounded by the checker's own limit; max_concurrency
+        optionally narrows it further for this call.
+        """
         providers = ["anthropic", "openai", "azure"]
-        tasks = [self.check_provider_health(provider) for provider in providers]
-        results = await asyncio.gather(*tasks)
+        if max_concurrency is None:
+            results = await asyncio.gather(*(self.check_provider_health(provider) for provider in providers))
+        else:
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def check(provider: str) -> APIHealthResult:
+                async with semaphore:
+                    return await self.check_provider_health(provider)
+            
+            results = await asyncio.gather(*(check(provider) for provider in providers))
         
         return {result.provider: result for result in results}
     
     async def wait_for_api_recovery(self, provider: str, max_wait: float = 300.0, 
-                                  check_interval: float = 30.0) -> bool:
-        """Wait for API to recover, checking periodically."""
+                                  check_interval: float = 30.0, backoff_base: float = 1.3) -> bool:
+        """Wait for API to recover, polling with exponential backoff capped at check_interval."""
         start_time = time.time()
+        interval = 1.0
         
         self.logger.info(f"Waiting for {provider} API recovery (max {max_wait}s)")
         
@@ -193,23 +314,37 @@ class APIChecker:
                 self.logger.info(f"{provider} API recovered after {recovery_time:.1f}s")
                 return True
             
-            self.logger.debug(f"{provider} still unavailable: {result.error_message}")
-            await asyncio.sleep(check_interval)
+            # Poll often early on to catch short outages, then taper off
+            delay = min(interval, check_interval, max_wait - (time.time() - start_time))
+            if delay <= 0:
+                break
+            self.logger.debug(f"{provider} still unavailable: {result.error_message}; "
+                              f"next check in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            interval *= backoff_base
         
         self.logger.warning(f"{provider} API did not recover within {max_wait}s")
         return False
 
 
+# Checker (and its pooled session) shared by quick_health_check calls on the same event
+# loop; it is closed on that loop when the loop shuts down
+_shared_checker = LoopScopedResource(lambda: APIChecker(timeout=5.0), APIChecker.close)
+
+
+async def get_checker() -> APIChecker:
+    """Return the shared APIChecker for the running event loop, creating it on first use."""
+    return await _shared_checker.get()
+
+
 async def quick_health_check(providers: list = None) -> Dict[str, bool]:
     """Quick health check returning simple availability status."""
     if providers is None:
         providers = ["anthropic", "openai"]
     
-    checker = APIChecker(timeout=5.0)
-    results = {}
-    
-    for provider in providers:
-        result = await checker.check_provider_health(provider)
-        results[provider] = result.available
+    checker = await get_checker()
+    results = await asyncio.gather(
+        *(checker.check_provider_health(provider) for provider in providers)
+    )
     
-    return results
\ No newline at end of file
+    return {provider: result.available for provider, result in zip(providers, results)}
\ No newline at end of file
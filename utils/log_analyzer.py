@@ -7,14 +7,178 @@ Advanced log analysis utilities for detecting framework failures and patterns.
 Based on patterns identified in ai_coder.py fallback system.
 """
 
+import functools
+import mmap
 import re
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 from dataclasses import dataclass
 
+try:
+    # Optional DFA multi-pattern matcher for scanning large (bytes) log content
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
 
-@dataclass
+
+@functools.lru_cache(maxsize=None)
+def _compile_pattern(pattern: str, as_bytes: bool) -> "re.Pattern":
+    """Compile a case-insensitive pattern for str or bytes content (cached)."""
+    return re.compile(pattern.encode("utf-8") if as_bytes else pattern, re.IGNORECASE)
+
+
+class _PatternSet:
+    """A category's patterns: one fused alternation to reject clean content in a single scan,
+    plus the individual regexes to report which patterns actually matched."""
+    
+    __slots__ = ("patterns", "_compiled")
+    
+    def __init__(self, patterns: List[str]):
+        self.patterns = tuple(patterns)
+        self._compiled: Dict[bool, tuple] = {}
+    
+    def _regexes(self, as_bytes: bool) -> tuple:
+        compiled = self._compiled.get(as_bytes)
+        if compiled is None:
+            fused = _compile_pattern("|".join(f"(?:{p})" for p in self.patterns), as_bytes)
+            individual = tuple(_compile_pattern(p, as_bytes) for p in self.patterns)
+            compiled = self._compiled[as_bytes] = (fused, individual)
+        return compiled
+    
+    def matches(self, content: Union[str, bytes]) -> List[str]:
+        """Return the patterns that match content, in declaration order."""
+        fused, individual = self._regexes(not isinstance(content, str))
+        if not fused.search(content):
+            return []
+        return [p for p, regex in zip(self.patterns, individual) if regex.search(content)]
+
+
+class _HyperscanScanner:
+    """Every pattern set compiled into one streaming Hyperscan database, so bytes content
+    is scanned once for all patterns instead of once per category."""
+    
+    CHUNK_SIZE = 1 << 20
+    
+    def __init__(self, pattern_sets: tuple):
+        # Ids follow declaration order, so sorted hits keep each set's pattern order
+        self._owners = [(pattern_set, pattern) for pattern_set in pattern_sets for pattern in pattern_set.patterns]
+        self._database = hyperscan.Database(mode=hyperscan.HS_MODE_STREAM)
+        self._database.compile(
+            expressions=[pattern.encode("utf-8") for _, pattern in self._owners],
+            ids=list(range(len(self._owners))),
+            elements=len(self._owners),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(self._owners)
+        )
+    
+    def scan(self, content: bytes) -> Dict[_PatternSet, List[str]]:
+        """Return the matching patterns of each pattern set that has any."""
+        hits = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(pattern_id)
+        
+        # Feed the content in bounded chunks; the stream carries match state across chunk edges
+        with self._database.stream(match_event_handler=on_match) as stream:
+            for offset in range(0, len(content), self.CHUNK_SIZE):
+                stream.scan(content[offset:offset + self.CHUNK_SIZE])
+        
+        matches: Dict[_PatternSet, List[str]] = {}
+        for pattern_id in sorted(hits):
+            pattern_set, pattern = self._owners[pattern_id]
+            matches.setdefault(pattern_set, []).append(pattern)
+        return matches
+
+
+@functools.lru_cache(maxsize=None)
+def _hyperscan_scanner(pattern_sets: tuple) -> Optional[_HyperscanScanner]:
+    """Build the Hyperscan database for pattern_sets once (cached); None if it will not compile."""
+    try:
+        return _HyperscanScanner(pattern_sets)
+    except Exception as e:
+        # Hyperscan rejects some re syntax (e.g. backreferences); re handles everything
+        logging.getLogger(__name__).warning(f"Hyperscan unavailable for log patterns, using re: {e}")
+        return None
+
+
+# Metric patterns for extract_error_metrics. Metrics are per line, so the duration and
+# timestamp patterns consume the rest of the line (only the first hit per line counts),
+# and [^\S\n] keeps whitespace from crossing a line break.
+_LEVEL_RE = re.compile(r'ERROR|WARNING|CRITICAL', re.IGNORECASE)
+_ERROR_RE = re.compile(r'ERROR', re.IGNORECASE)
+_WARNING_RE = re.compile(r'WARNING', re.IGNORECASE)
+_TIME_RE = re.compile(r'(\d+\.?\d*)[^\S\n]*seconds?[^\n]*')
+_TIMESTAMP_RE = re.compile(r'(\d{4}-\d{2}-\d{2}[^\S\n]\d{2}:\d{2}:\d{2})[^\n]*')
+
+# The same metric patterns for bytes content (e.g. a memory-mapped log file),
+# keyed by whether the content is bytes
+_METRIC_RES = {
+    False: ('\n', _LEVEL_RE, _ERROR_RE, _WARNING_RE, _TIME_RE, _TIMESTAMP_RE),
+    True: (b'\n',) + tuple(
+        re.compile(regex.pattern.encode("ascii"), regex.flags & re.IGNORECASE)
+        for regex in (_LEVEL_RE, _ERROR_RE, _WARNING_RE, _TIME_RE, _TIMESTAMP_RE)
+    ),
+}
+
+
+# Remediation suggestions per critical category, framework and execution category
+_SUGGESTIONS_CRITICAL: Dict[str, Tuple[str, ...]] = {
+    "authentication": (
+        "Check API key validity and expiration",
+        "Verify environment variables are set correctly",
+        "Rotate API key if compromised"
+    ),
+    "rate_limiting": (
+        "Implement exponential backoff",
+        "Check API usage quotas",
+        "Consider upgrading API plan"
+    ),
+    "network": (
+        "Check internet connectivity",
+        "Verify firewall settings",
+        "Try alternative network endpoint"
+    ),
+    "resource": (
+        "Monitor system resource usage",
+        "Increase timeout values",
+        "Check available disk space"
+    )
+}
+
+_SUGGESTIONS_FRAMEWORK: Dict[str, Tuple[str, ...]] = {
+    "claude": (
+        "Check Claude SDK installation and version",
+        "Verify MCP server configuration",
+        "Review Claude API status page"
+    ),
+    "opencode": (
+        "Check OpenCode SDK installation",
+        "Verify provider API keys",
+        "Try alternative provider/model"
+    )
+}
+
+_SUGGESTIONS_EXECUTION: Dict[str, Tuple[str, ...]] = {
+    "import_errors": (
+        "Check Python package installation",
+        "Verify PYTHONPATH configuration",
+        "Install missing dependencies"
+    ),
+    "syntax_errors": (
+        "Review generated code for syntax issues",
+        "Check Python version compatibility",
+        "Validate code formatting"
+    ),
+    "runtime_errors": (
+        "Check input data validity",
+        "Review error stack trace",
+        "Validate program logic"
+    )
+}
+
+
+@dataclass(slots=True, frozen=True)
 class LogAnalysisResult:
     """Result of log analysis operation."""
     has_errors: bool
@@ -98,195 +262,201 @@ class LogAnalyzer:
         ]
     }
     
+    # Compiled pattern sets, built once at class creation
+    _CRITICAL_SETS = {category: _PatternSet(patterns) for category, patterns in CRITICAL_PATTERNS.items()}
+    _FRAMEWORK_SETS = {framework: _PatternSet(patterns) for framework, patterns in FRAMEWORK_PATTERNS.items()}
+    _EXECUTION_SETS = {category: _PatternSet(patterns) for category, patterns in EXECUTION_PATTERNS.items()}
+    _ALL_SETS = (*_CRITICAL_SETS.values(), *_FRAMEWORK_SETS.values(), *_EXECUTION_SETS.values())
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
     
-    def analyze_log_content(self, log_content: str, framework: str = None) -> LogAnalysisResult:
+    def analyze_log_file(self, log_file_path: str, framework: str = None) -> LogAnalysisResult:
+        """
+        Analyze a log file by scanning a read-only memory map of it.
+        
+        The file is never decoded into a str; patterns run directly on the mapped bytes.
+        """
+        with open(log_file_path, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return self.analyze_log_content(b"", framework)
+            with mapped:
+                return self.analyze_log_content(mapped, framework)
+    
+    def analyze_log_content(self, log_content: Union[str, bytes], framework: str = None) -> LogAnalysisResult:
         """
         Comprehensive analysis of log content for failure detection.
         
         Args:
-            log_content: Raw log content to analyze
+            log_content: Raw log content to analyze (str, or bytes-like such as an mmap)
             framework: Specific framework context (claude, opencode)
             
         Returns:
             LogAnalysisResult with detailed analysis
         """
         
-        result = LogAnalysisResult(
-            has_errors=False,
-            error_type=None,
-            error_patterns=[],
-            severity="low",
-            confidence=0.0,
-            suggestions=[]
-        )
+        has_errors = False
+        error_type = None
+        error_patterns: List[str] = []
+        severity = "low"
+        confidence = 0.0
+        suggestions: List[str] = []
+        prescanned = self._prescan(log_content)
         
-        # Check critical patterns first (highest severity)
-        for category, patterns in self.CRITICAL_PATTERNS.items():
-            matches = self._check_patterns(log_content, patterns)
+        # Check critical patterns first (highest severity). error_type holds a single
+        # category, so stop at the first one that matches instead of scanning the rest.
+        for category, pattern_set in self._CRITICAL_SETS.items():
+            matches = self._check_patterns(log_content, pattern_set, prescanned)
             if matches:
-                result.has_errors = True
-                result.error_type = category
-                result.error_patterns.extend(matches)
-                result.severity = "critical"
-                result.confidence = 0.9
-                result.suggestions.extend(self._get_suggestions(category))
+                has_errors = True
+                error_type = category
+                error_patterns.extend(matches)
+                severity = "critical"
+                confidence = 0.9
+                suggestions.extend(self._get_suggestions(category))
+                break
         
         # Check framework-specific patterns
-        if framework and framework in self.FRAMEWORK_PATTERNS:
-            matches = self._check_patterns(log_content, self.FRAMEWORK_PATTERNS[framework])
+        if framework and framework in self._FRAMEWORK_SETS:
+            matches = self._check_patterns(log_content, self._FRAMEWORK_SETS[framework], prescanned)
             if matches:
-                result.has_errors = True
-                if not result.error_type:
-                    result.error_type = f"{framework}_specific"
-                result.error_patterns.extend(matches)
-                result.severity = max(result.severity, "high", key=self._severity_weight)
-                result.confidence = max(result.confidence, 0.8)
-                result.suggestions.extend(self._get_framework_suggestions(framework))
+                has_errors = True
+                if not error_type:
+                    error_type = f"{framework}_specific"
+                error_patterns.extend(matches)
+                severity = max(severity, "high", key=self._severity_weight)
+                confidence = max(confidence, 0.8)
+                suggestions.extend(self._get_framework_suggestions(framework))
         
         # Check execution patterns (medium severity)
-        if not result.has_errors:
-            for category, patterns in self.EXECUTION_PATTERNS.items():
-                matches = self._check_patterns(log_content, patterns)
+        if not has_errors:
+            for category, pattern_set in self._EXECUTION_SETS.items():
+                matches = self._check_patterns(log_content, pattern_set, prescanned)
                 if matches:
-                    result.has_errors = True
-                    result.error_type = category
-                    result.error_patterns.extend(matches)
-                    result.severity = "medium"
-                    result.confidence = 0.7
-                    result.suggestions.extend(self._get_execution_suggestions(category))
+                    has_errors = True
+                    error_type = category
+                    error_patterns.extend(matches)
+                    severity = "medium"
+                    confidence = 0.7
+                    suggestions.extend(self._get_execution_suggestions(category))
                     break
         
-        return result
+        return LogAnalysisResult(
+            has_errors=has_errors,
+            error_type=error_type,
+            error_patterns=error_patterns,
+            severity=severity,
+            confidence=confidence,
+            # Drop repeated suggestions, keeping first-seen order
+            suggestions=list(dict.fromkeys(suggestions))
+        )
     
-    def _check_patterns(self, content: str, patterns: List[str]) -> List[str]:
-        """Check content against list of regex patterns."""
-        matches = []
-        for pattern in patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                matches.append(pattern)
-        return matches
+    def _prescan(self, content: Union[str, bytes]) -> Optional[Dict[_PatternSet, List[str]]]:
+        """
+        Match bytes content against every pattern set in a single Hyperscan pass.
+        
+        Returns None when Hyperscan is not installed, cannot compile the patterns, or the
+        content is a str (which keeps re's Unicode-aware case folding); pattern sets are then
+        checked one by one with re.
+        """
+        if not HYPERSCAN_AVAILABLE or isinstance(content, str):
+            return None
+        scanner = _hyperscan_scanner(self._ALL_SETS)
+        return scanner.scan(content) if scanner is not None else None
+    
+    def _check_patterns(self, content: Union[str, bytes], pattern_set: _PatternSet,
+                        prescanned: Optional[Dict[_PatternSet, List[str]]] = None) -> List[str]:
+        """Check content against a compiled pattern set."""
+        if prescanned is not None:
+            return prescanned.get(pattern_set, [])
+        return pattern_set.matches(content)
     
     def _severity_weight(self, severity: str) -> int:
         """Get numeric weight for severity comparison."""
         weights = {"low": 1, "medium": 2, "high": 3, "critical": 4}
         return weights.get(severity, 0)
     
-    def _get_suggestions(self, category: str) -> List[str]:
+    def _get_suggestions(self, category: str) -> Tuple[str, ...]:
         """Get remediation suggestions for error category."""
-        suggestions = {
-            "authentication": [
-                "Check API key validity and expiration",
-                "Verify environment variables are set correctly",
-                "Rotate API key if compromised"
-            ],
-            "rate_limiting": [
-                "Implement exponential backoff",
-                "Check API usage quotas",
-                "Consider upgrading API plan"
-            ],
-            "network": [
-                "Check internet connectivity",
-                "Verify firewall settings",
-                "Try alternative network endpoint"
-            ],
-            "resource": [
-                "Monitor system resource usage",
-                "Increase timeout values",
-                "Check available disk space"
-            ]
-        }
-        return suggestions.get(category, ["Review error logs for specific details"])
+        return _SUGGESTIONS_CRITICAL.get(category, ("Review error logs for specific details",))
     
-    def _get_framework_suggestions(self, framework: str) -> List[str]:
+    def _get_framework_suggestions(self, framework: str) -> Tuple[str, ...]:
         """Get framework-specific suggestions."""
-        suggestions = {
-            "claude": [
-                "Check Claude SDK installation and version",
-                "Verify MCP server configuration",
-                "Review Claude API status page"
-            ],
-            "opencode": [
-                "Check OpenCode SDK installation",
-                "Verify provider API keys",
-                "Try alternative provider/model"
-            ]
-        }
-        return suggestions.get(framework, ["Check framework documentation"])
+        return _SUGGESTIONS_FRAMEWORK.get(framework, ("Check framework documentation",))
     
-    def _get_execution_suggestions(self, category: str) -> List[str]:
+    def _get_execution_suggestions(self, category: str) -> Tuple[str, ...]:
         """Get execution error suggestions."""
-        suggestions = {
-            "import_errors": [
-                "Check Python package installation",
-                "Verify PYTHONPATH configuration",
-                "Install missing dependencies"
-            ],
-            "syntax_errors": [
-                "Review generated code for syntax issues",
-                "Check Python version compatibility",
-                "Validate code formatting"
-            ],
-            "runtime_errors": [
-                "Check input data validity",
-                "Review error stack trace",
-                "Validate program logic"
-            ]
-        }
-        return suggestions.get(category, ["Review execution environment"])
+        return _SUGGESTIONS_EXECUTION.get(category, ("Review execution environment",))
     
-    def extract_error_metrics(self, log_content: str) -> Dict[str, Any]:
-        """Extract quantitative metrics from log content."""
-        metrics = {
-            "error_count": 0,
-            "warning_count": 0,
-            "critical_count": 0,
-            "response_times": [],
-            "error_types": {},
-            "timestamp_range": None
-        }
+    def extract_error_metrics(self, log_content: Union[str, bytes]) -> Dict[str, Any]:
+        """Extract quantitative metrics from log content (str, or bytes-like such as an mmap)."""
+        error_count = warning_count = critical_count = 0
+        as_bytes = not isinstance(log_content, str)
+        newline, level_re, error_re, warning_re, time_re, timestamp_re = _METRIC_RES[as_bytes]
         
-        lines = log_content.split('\n')
+        # Count error levels: jump between lines that mention a level, one count per line
+        # with ERROR > WARNING > CRITICAL precedence
+        end_of_content = len(log_content)
+        match = level_re.search(log_content)
+        while match:
+            line_start = log_content.rfind(newline, 0, match.start()) + 1
+            line_end = log_content.find(newline, match.end())
+            if line_end < 0:
+                line_end = end_of_content
+            if error_re.search(log_content, line_start, line_end):
+                error_count += 1
+            elif warning_re.search(log_content, line_start, line_end):
+                warning_count += 1
+            else:
+                critical_count += 1
+            match = level_re.search(log_content, line_end)
         
-        for line in lines:
-            # Count error levels
-            if re.search(r'ERROR', line, re.IGNORECASE):
-                metrics["error_count"] += 1
-            elif re.search(r'WARNING', line, re.IGNORECASE):
-                metrics["warning_count"] += 1
-            elif re.search(r'CRITICAL', line, re.IGNORECASE):
-                metrics["critical_count"] += 1
-            
-            # Extract response times
-            time_match = re.search(r'(\d+\.?\d*)\s*seconds?', line)
-            if time_match:
-                metrics["response_times"].append(float(time_match.group(1)))
-            
-            # Extract timestamps for range calculation
-            timestamp_match = re.search(r'(\d{4}-\d{2}-\d{2}\s\d{2}:\d{2}:\d{2})', line)
-            if timestamp_match:
-                try:
-                    timestamp = datetime.strptime(timestamp_match.group(1), '%Y-%m-%d %H:%M:%S')
-                    if not metrics["timestamp_range"]:
-                        metrics["timestamp_range"] = [timestamp, timestamp]
-                    else:
-                        metrics["timestamp_range"][0] = min(metrics["timestamp_range"][0], timestamp)
-                        metrics["timestamp_range"][1] = max(metrics["timestamp_range"][1], timestamp)
-                except ValueError:
-                    pass
+        # Extract response times
+        response_times = [float(value) for value in time_re.findall(log_content)]
         
-        return metrics
+        # Extract timestamps for range calculation
+        first_ts = last_ts = None
+        for timestamp_text in timestamp_re.findall(log_content):
+            if as_bytes:
+                timestamp_text = timestamp_text.decode("ascii")
+            try:
+                timestamp = _parse_timestamp(timestamp_text)
+            except ValueError:
+                continue
+            if first_ts is None:
+                first_ts = last_ts = timestamp
+            elif timestamp < first_ts:
+                first_ts = timestamp
+            elif timestamp > last_ts:
+                last_ts = timestamp
+        
+        return {
+            "error_count": error_count,
+            "warning_count": warning_count,
+            "critical_count": critical_count,
+            "response_times": response_times,
+            "error_types": {},
+            "timestamp_range": [first_ts, last_ts] if first_ts is not None else None
+        }
+
+
+def _parse_timestamp(text: str) -> datetime:
+    """Parse a 'YYYY-MM-DD HH:MM:SS' timestamp, using the C fromisoformat fast path when it applies."""
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        # Non-ASCII digits or separators fromisoformat rejects
+        return datetime.strptime(text, '%Y-%m-%d %H:%M:%S')
 
 
 def analyze_framework_logs(log_file_path: str, framework: str) -> LogAnalysisResult:
-    """Convenience function to analyze framework log file."""
+    """Convenience function to analyze framework log file (memory-mapped, not read into memory)."""
     try:
-        with open(log_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         analyzer = LogAnalyzer()
-        return analyzer.analyze_log_content(content, framework)
+        return analyzer.analyze_log_file(log_file_path, framework)
     
     except Exception as e:
         return LogAnalysisResult(
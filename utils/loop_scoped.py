@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Loop-Scoped Shared Resources
+============================
+
+Share one async client (HTTP session, SDK client) per event loop and close it
+on that same loop when the loop shuts down.
+"""
+
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable
+
+
+class LoopScopedResource:
+    """
+    One lazily created resource per running event loop.
+    
+    Connection pools are bound to the loop that opened them, so each loop gets its
+    own resource. Its close coroutine runs on that loop from an async generator
+    finalizer, i.e. when the loop runs shutdown_asyncgens() (asyncio.run does this
+    before closing the loop), or earlier through close().
+    """
+    
+    def __init__(self, factory: Callable[[], Any], closer: Callable[[Any], Awaitable]):
+        self._factory = factory
+        self._closer = closer
+        # loop -> (resource, lifetime generator); the generator is kept alive here
+        # because the loop only tracks async generators weakly
+        self._entries: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = weakref.WeakKeyDictionary()
+    
+    async def get(self) -> Any:
+        """Return the running loop's resource, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        entry = self._entries.get(loop)
+        if entry is None:
+            resource = self._factory()
+            lifetime = self._lifetime(loop, resource)
+            entry = self._entries[loop] = (resource, lifetime)
+            # First iteration registers the generator with the loop's shutdown hooks
+            await lifetime.asend(None)
+        return entry[0]
+    
+    async def close(self):
+        """Close the running loop's resource now, if it has one."""
+        entry = self._entries.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+    
+    async def _lifetime(self, loop: asyncio.AbstractEventLoop, resource: Any):
+        """Suspend until the loop finalizes this generator, then close resource on it."""
+        try:
+            yield
+        finally:
+            # Drop the entry first: the resource may reference the loop, which would
+            # otherwise keep the weak key alive
+            self._entries.pop(loop, None)
+            await self._closer(resource)
@@ -6,15 +6,24 @@ Metrics Collection Utilities
 Collect and aggregate performance metrics for framework monitoring.
 """
 
+import bisect
 import json
+import math
 import time
+from array import array
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
-import statistics
 
+try:
+    # Optional faster JSON encoder for metric exports
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MetricPoint:
     """Single metric data point."""
     timestamp: float
@@ -28,64 +37,136 @@ class MetricsCollector:
     """Collect and aggregate performance metrics."""
     
     def __init__(self, retention_hours: int = 24):
-        self.metrics: List[MetricPoint] = []
         self.retention_hours = retention_hours
+        # Struct-of-arrays storage, one column per MetricPoint field, in insertion order.
+        # Wall-clock timestamps can step backwards (NTP, manual changes), so retention and
+        # time windows are located with bisect on a parallel time.monotonic() column, which
+        # never decreases; the wall-clock column is only exported.
+        self._timestamps = array('d')
+        self._ticks = array('d')
+        self._values = array('d')
+        self._framework_ids = array('i')
+        self._type_ids = array('i')
+        self._metadata: List[Dict[str, Any]] = []
+        # Framework and metric type names come from a small vocabulary, so each is
+        # interned to a small int id (name -> id, and id -> name for reading back)
+        self._framework_index: Dict[str, int] = {}
+        self._framework_names: List[str] = []
+        self._type_index: Dict[str, int] = {}
+        self._type_names: List[str] = []
+        # Expired points are dropped in batches rather than on every insert; the metrics
+        # property trims first and summaries clamp their window to the retention period,
+        # so neither sees points past retention
+        self._cleanup_every = 1000
+        self._inserts_since_cleanup = 0
+    
+    @property
+    def metrics(self) -> List[MetricPoint]:
+        """Retained metric points, oldest first."""
+        self._cleanup_old_metrics()
+        framework_names, type_names = self._framework_names, self._type_names
+        return [
+            MetricPoint(timestamp, framework_names[framework_id], type_names[type_id], value, metadata)
+            for timestamp, framework_id, type_id, value, metadata in zip(
+                self._timestamps, self._framework_ids, self._type_ids,
+                self._values, self._metadata
+            )
+        ]
+    
+    @staticmethod
+    def _intern(name: str, index: Dict[str, int], names: List[str]) -> int:
+        """Return the id for name, assigning the next one on first sight."""
+        name_id = index.get(name)
+        if name_id is None:
+            name_id = index[name] = len(names)
+            names.append(name)
+        return name_id
     
     def record_metric(self, framework: str, metric_type: str, 
                      value: float, metadata: Dict[str, Any] = None):
         """Record a metric point."""
-        point = MetricPoint(
-            timestamp=time.time(),
-            framework=framework,
-            metric_type=metric_type,
-            value=value,
-            metadata=metadata or {}
-        )
+        self._timestamps.append(time.time())
+        self._ticks.append(time.monotonic())
+        self._values.append(value)
+        self._framework_ids.append(self._intern(framework, self._framework_index, self._framework_names))
+        self._type_ids.append(self._intern(metric_type, self._type_index, self._type_names))
+        self._metadata.append(metadata or {})
         
-        self.metrics.append(point)
-        self._cleanup_old_metrics()
+        self._inserts_since_cleanup += 1
+        if self._inserts_since_cleanup >= self._cleanup_every:
+            self._cleanup_old_metrics()
     
     def _cleanup_old_metrics(self):
         """Remove metrics older than retention period."""
-        cutoff = time.time() - (self.retention_hours * 3600)
-        self.metrics = [m for m in self.metrics if m.timestamp >= cutoff]
+        self._inserts_since_cleanup = 0
+        cutoff = time.monotonic() - (self.retention_hours * 3600)
+        expired = bisect.bisect_left(self._ticks, cutoff)
+        if expired:
+            for column in (self._timestamps, self._ticks, self._values, self._framework_ids,
+                           self._type_ids, self._metadata):
+                del column[:expired]
     
     def get_framework_summary(self, framework: str, 
                             hours: int = 1) -> Dict[str, Any]:
         """Get summary statistics for a framework."""
-        cutoff = time.time() - (hours * 3600)
+        # Points past retention may still be stored until the next batched cleanup
+        cutoff = time.monotonic() - min(hours, self.retention_hours) * 3600
+        start = bisect.bisect_left(self._ticks, cutoff)
+        framework_id = self._framework_index.get(framework)
+        if framework_id is None:
+            return {"error": "No metrics found"}
         
-        framework_metrics = [
-            m for m in self.metrics 
-            if m.framework == framework and m.timestamp >= cutoff
-        ]
+        # One pass over the window: group by metric type id while tracking count/min/max/latest
+        # and Welford's running mean/M2 (per type: [count, mean, m2, min, max, latest]).
+        # Plain float math is enough for latency-style metrics; the exact-rational
+        # accumulation in the statistics module is not needed here.
+        by_type: Dict[int, list] = {}
+        framework_ids, type_ids, values = self._framework_ids, self._type_ids, self._values
+        for i in range(start, len(values)):
+            if framework_ids[i] != framework_id:
+                continue
+            value = values[i]
+            acc = by_type.get(type_ids[i])
+            if acc is None:
+                by_type[type_ids[i]] = [1, value, 0.0, value, value, value]
+                continue
+            count = acc[0] = acc[0] + 1
+            delta = value - acc[1]
+            acc[1] += delta / count
+            acc[2] += delta * (value - acc[1])
+            if value < acc[3]:
+                acc[3] = value
+            elif value > acc[4]:
+                acc[4] = value
+            acc[5] = value
         
-        if not framework_metrics:
+        if not by_type:
             return {"error": "No metrics found"}
         
-        # Group by metric type
-        by_type = {}
-        for metric in framework_metrics:
-            if metric.metric_type not in by_type:
-                by_type[metric.metric_type] = []
-            by_type[metric.metric_type].append(metric.value)
-        
         # Calculate statistics
         summary = {}
-        for metric_type, values in by_type.items():
+        for type_id, (count, mean, m2, low, high, latest) in by_type.items():
+            metric_type = self._type_names[type_id]
             summary[metric_type] = {
-                "count": len(values),
-                "avg": statistics.mean(values),
-                "min": min(values),
-                "max": max(values),
-                "latest": values[-1] if values else 0
+                "count": count,
+                "avg": mean,
+                "min": low,
+                "max": high,
+                "latest": latest
             }
             
-            if len(values) > 1:
-                summary[metric_type]["std"] = statistics.stdev(values)
+            if count > 1:
+                summary[metric_type]["std"] = math.sqrt(m2 / (count - 1))
         
         return summary
     
     def export_metrics(self) -> List[Dict[str, Any]]:
         """Export all metrics as JSON-serializable format."""
-        return [asdict(metric) for metric in self.metrics]
\ No newline at end of file
+        return [asdict(metric) for metric in self.metrics]
+    
+    def export_metrics_bytes(self) -> bytes:
+        """Export all metrics as UTF-8 JSON bytes, for writing straight to a file or socket."""
+        if ORJSON_AVAILABLE:
+            # orjson serializes the dataclasses directly, without building a dict per point
+            return orjson.dumps(self.metrics)
+        return json.dumps(self.export_metrics()).encode("utf-8")